@@ -0,0 +1,158 @@
+"""Benchmark every implementation in solutions/ against the others.
+
+Usage (from the repository root):
+    python -m ads_libs.bench [--problems DrivingLicences MusicPlayer] [--sizes 1e3,1e4,1e5]
+                             [--distribution zipf] [--filter teacher] [--json results.json]
+
+Every solution found by ads_libs.discovery runs on the same generated workload
+(ads_libs.workload) at each size. Three runs per solution and size:
+    throughput  plain run over the whole workload, in ops/s
+    latency     per-operation p50/p99. For solutions built on ads_libs.dispatch it is
+                the time spent in each handler (ads_libs.dispatch.enable_stats), so
+                parsing is only in the throughput figure; other solutions are handed
+                the operations by a generator that reads the clock around each one.
+                Solutions that set BATCHED = True read the whole program before
+                running it, so they have no per-operation latency and show "-".
+    memory      peak traced allocation (tracemalloc) during the run
+Anything a solution prints is discarded; a solution that crashes is reported as failed.
+"""
+import argparse
+import contextlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+sys.path.append(".")
+
+from ads_libs.discovery import discover_solutions, load_solution, solution_name
+from ads_libs.dispatch import disable_stats, enable_stats
+from ads_libs.stats import LatencyHistogram
+from ads_libs.workload import generate
+
+
+def _test_cases(lines):
+    test_case = []
+    for line in lines:
+        if line == "FIN":
+            yield test_case
+            test_case = []
+        else:
+            test_case.append(line)
+
+
+def _timed(operations, record):
+    clock = time.perf_counter_ns
+    for op in operations:
+        start = clock()
+        yield op # the consumer processes op before asking for the next one
+        record(clock() - start)
+
+
+def measure(module, test_cases): # O(ops)
+    ops = sum(len(test_case) for test_case in test_cases)
+    with contextlib.redirect_stdout(io.StringIO()) as sink:
+        start = time.perf_counter()
+        for test_case in test_cases:
+            module.process_operations(test_case)
+            sink.seek(0)
+            sink.truncate()
+        elapsed = time.perf_counter() - start
+
+        latency = LatencyHistogram()
+        if not getattr(module, "BATCHED", False):
+            stats = enable_stats()
+            try:
+                for test_case in test_cases:
+                    module.process_operations(test_case)
+                    sink.seek(0)
+                    sink.truncate()
+            finally:
+                disable_stats()
+            for histogram in stats.latency.values():
+                latency.merge(histogram)
+            if not latency.total: # not built on ads_libs.dispatch
+                for test_case in test_cases:
+                    module.process_operations(_timed(test_case, latency.record))
+                    sink.seek(0)
+                    sink.truncate()
+
+        tracemalloc.start()
+        for test_case in test_cases:
+            module.process_operations(test_case)
+            sink.seek(0)
+            sink.truncate()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "ops": ops,
+        "ops_per_sec": ops / elapsed if elapsed else float("inf"),
+        "p50_us": latency.percentile(0.50) / 1000 if latency.total else None,
+        "p99_us": latency.percentile(0.99) / 1000 if latency.total else None,
+        "peak_mb": peak / 2**20,
+    }
+
+
+def run_benchmarks(problems, sizes, name_filter=None, **workload):
+    # Yields one result dict per (problem, size, solution)
+    solutions = discover_solutions()
+    for problem in problems:
+        modules = []
+        for path in solutions[problem]:
+            name = solution_name(path)
+            if name_filter and name_filter not in name:
+                continue
+            try:
+                modules.append((name, load_solution(path)))
+            except Exception as e: # e.g. an optional dependency is not installed
+                yield {"problem": problem, "solution": name, "size": None, "error": f"import failed: {e!r}"}
+
+        for size in sizes:
+            test_cases = list(_test_cases(generate(problem, size, **workload)))
+            for name, module in modules:
+                result = {"problem": problem, "solution": name, "size": size}
+                try:
+                    result.update(measure(module, test_cases))
+                except Exception as e:
+                    tracemalloc.stop()
+                    result["error"] = repr(e)
+                yield result
+
+
+def _format(result):
+    head = f"{result['problem']:<16} {result['size'] or '-':>9} {result['solution']:<44}"
+    if "error" in result:
+        return f"{head} FAILED: {result['error']}"
+    p50, p99 = ("-" if result[key] is None else f"{result[key]:.2f}" for key in ("p50_us", "p99_us"))
+    return f"{head} {result['ops_per_sec']:>12,.0f} {p50:>9} {p99:>9} {result['peak_mb']:>9.2f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every solution on generated workloads")
+    parser.add_argument("--problems", nargs="+", default=["DrivingLicences", "DrivingSchool", "MusicPlayer"])
+    parser.add_argument("--sizes", default="1e3,1e4,1e5",
+                        type=lambda text: [int(float(size)) for size in text.split(",")])
+    parser.add_argument("--distribution", choices=["uniform", "zipf"], default="uniform")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--cases", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--filter", help="only solutions whose name contains this text")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    print(f"{'problem':<16} {'ops':>9} {'solution':<44} {'ops/s':>12} {'p50 us':>9} {'p99 us':>9} {'peak MB':>9}")
+    results = []
+    for result in run_benchmarks(args.problems, args.sizes, args.filter, cases=args.cases,
+                                 distribution=args.distribution, error_rate=args.error_rate,
+                                 seed=args.seed):
+        results.append(result)
+        print(_format(result), flush=True)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
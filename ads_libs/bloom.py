@@ -0,0 +1,78 @@
+import math
+
+
+def _hash_pair(key):
+    # Two hashes of the key, the second one odd so every probe step is distinct
+    h = hash(key)
+    return h, hash((h, key)) | 1
+
+
+class BloomFilter:
+    # Set membership with no false negatives and a false positive rate of about
+    # error_rate once `capacity` keys have been added. Keys are hashed with hash(),
+    # so a filter is only meaningful inside the process that built it.
+    def __init__(self, capacity, error_rate=0.01):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))  # bits
+        self.hashes = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def add(self, key): # O(hashes)
+        self.add_hashed(*_hash_pair(key))
+
+    def __contains__(self, key): # O(hashes)
+        return self.contains_hashed(*_hash_pair(key))
+
+    def add_hashed(self, h1, h2): # positions h1 + i * h2 (double hashing)
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def contains_hashed(self, h1, h2):
+        bits, size = self.bits, self.size
+        for i in range(self.hashes):
+            position = (h1 + i * h2) % size
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+    def expected_error_rate(self): # false positive rate for the keys added so far
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+class ScalableBloomFilter:
+    # Bloom filter that grows: when the current filter is full a new one with twice
+    # the capacity and half the error rate is added, so the overall false positive
+    # rate stays below 2 * error_rate however many keys are added.
+    def __init__(self, capacity=1024, error_rate=0.01):
+        self.filters = [BloomFilter(capacity, error_rate / 2)]
+
+    def add(self, key): # O(hashes) amortized
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(2 * current.capacity, current.error_rate / 2)
+            self.filters.append(current)
+        current.add_hashed(*_hash_pair(key))
+
+    def __contains__(self, key): # O(filters * hashes), the key is hashed once
+        h1, h2 = _hash_pair(key)
+        for bloom in self.filters:
+            if bloom.contains_hashed(h1, h2):
+                return True
+        return False
+
+    def __len__(self):
+        return sum(bloom.count for bloom in self.filters)
+
+    def expected_error_rate(self):
+        miss = 1.0
+        for bloom in self.filters:
+            miss *= 1 - bloom.expected_error_rate()
+        return 1 - miss
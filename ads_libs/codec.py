@@ -0,0 +1,40 @@
+# LEB128 varints, zigzag-encoded signed integers and length-prefixed byte strings,
+# shared by the binary formats of ads_libs.oplog and
+# solutions/teacher/driving_licenses_persistent.py. Writers append to a bytearray;
+# readers take the data and a position and return (value, position after it).
+
+
+def write_varint(out, value): # non-negative integers only
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def zigzag(value): # any int to a non-negative one: 0, -1, 1, -2, ... -> 0, 1, 2, 3, ...
+    return value << 1 if value >= 0 else (-value << 1) - 1
+
+
+def unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def write_bytes(out, data):
+    write_varint(out, len(data))
+    out += data
+
+
+def read_varint(data, pos):
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def read_bytes(data, pos):
+    size, pos = read_varint(data, pos)
+    return data[pos:pos + size], pos + size
@@ -0,0 +1,297 @@
+"""Empirical check of the Big-O comments on the ADT methods of every solution.
+
+Usage (from the repository root):
+    python -m ads_libs.complexity [--filter myleskoppelman] [--sizes 5] [--start 1000]
+
+For each solution found by ads_libs.discovery, the ADT class is located by its
+method names and filled through its own methods to states of doubling size n.
+For each method a fresh state is built and the method is timed over batches of
+--batch calls with distinct arguments (best of --repeat batches), and the growth
+exponent is the least-squares slope of log(time per call) against log(n).
+The claimed complexity is read from the comments next to the method, e.g.
+"def deleteSong(self, song): # O(1)" or "# Time: O(n)" on the following lines.
+A method is reported as MISMATCH when its measured exponent exceeds the claimed
+one by more than --tolerance; the exit status is 1 if there is any mismatch.
+"""
+import argparse
+import contextlib
+import inspect
+import io
+import math
+import re
+import sys
+import time
+sys.path.append(".")
+
+from ads_libs.discovery import discover_solutions, load_solution, solution_name
+
+# Canonical operation -> method names used by the different solutions
+ALIASES = {
+    "DrivingLicences": {
+        "nuevo": ["nuevo"], "quitar": ["quitar"], "consultar": ["consultar"],
+        "cuantos_con_puntos": ["cuantos_con_puntos"], "cuantos_en_rango": ["cuantos_en_rango"],
+        "conductores_con_puntos": ["conductores_con_puntos"],
+    },
+    "DrivingSchool": {
+        "alta": ["alta"], "es_alumno": ["es_alumno"], "puntuacion": ["puntuacion"],
+        "actualizar": ["actualizar"], "examen": ["examen"], "aprobar": ["aprobar"],
+        "mejores": ["mejores"], "rango": ["rango"], "transferir_todos": ["transferir_todos"],
+        "fusionar": ["fusionar"],
+    },
+    "MusicPlayer": {
+        "addSong": ["addSong"], "addToPlaylist": ["addToPlaylist"], "current": ["current", "currentSong"],
+        "play": ["play"], "totalTime": ["totalTime", "total_time"], "recent": ["recent", "recentSongs"],
+        "deleteSong": ["deleteSong", "delete_song"],
+    },
+}
+
+
+def _fill_licences(adt, n):
+    for i in range(n):
+        adt.nuevo(f"D{i}")
+    for i in range(0, n, 2):
+        adt.quitar(f"D{i}", i % 16)
+
+
+def _fill_school(adt, n):
+    # Half of the students share instructor P0 (examen over m ~ n/2 students),
+    # the other half are spread over a number of instructors that also grows with n
+    spread = n // 10 + 1
+    for i in range(n):
+        adt["alta"](f"A{i}", "P0" if i % 2 == 0 else f"P{1 + i % spread}")
+        adt["actualizar"](f"A{i}", i % 20)
+
+
+def _fill_music(adt, n):
+    # n songs in the playlist, the first half played and queued again, so a song
+    # in the middle is both in the playlist and in the recently played list
+    for i in range(n):
+        adt["addSong"](f"S{i}", "Artist", 100)
+        adt["addToPlaylist"](f"S{i}")
+    for i in range(n // 2):
+        adt["play"]()
+    for i in range(n // 2):
+        adt["addToPlaylist"](f"S{i}")
+
+
+# Canonical operation -> arguments of the j-th timed call on a state of size n.
+# Calls that change the state get distinct arguments, so every call does the same work
+# (j < n // 2 is guaranteed by check_solution).
+CALLS = {
+    "DrivingLicences": {
+        "nuevo": lambda n, j: (f"new{j}",), "quitar": lambda n, j: (f"D{n // 2 + j}", 1),
+        "consultar": lambda n, j: (f"D{n // 2 + j}",), "cuantos_con_puntos": lambda n, j: (15,),
+        "cuantos_en_rango": lambda n, j: (0, 10), "conductores_con_puntos": lambda n, j: (15,),
+    },
+    "DrivingSchool": {
+        "alta": lambda n, j: (f"new{j}", "P0"), "es_alumno": lambda n, j: (f"A{j}", "P0"),
+        "puntuacion": lambda n, j: (f"A{j}",), "actualizar": lambda n, j: (f"A{j}", 1),
+        "examen": lambda n, j: ("P0", 10), "aprobar": lambda n, j: (f"A{n // 2 + j}",),
+        "mejores": lambda n, j: (10,), "rango": lambda n, j: (f"A{j}",),
+        # P0's roster goes back and forth between P0 and Q
+        "transferir_todos": lambda n, j: ("P0", "Q") if j % 2 == 0 else ("Q", "P0"),
+        "fusionar": lambda n, j: ("P0", "Q") if j % 2 == 0 else ("Q", "P0"),
+    },
+    "MusicPlayer": {
+        "addSong": lambda n, j: (f"new{j}", "Artist", 100), "addToPlaylist": lambda n, j: (f"S{n - 1 - j}",),
+        "current": lambda n, j: (), "play": lambda n, j: (), "totalTime": lambda n, j: (),
+        "recent": lambda n, j: (10,), "deleteSong": lambda n, j: (f"S{(n // 4 + j) % (n // 2)}",),
+    },
+}
+
+FILL = {
+    "DrivingLicences": lambda adt, n: _fill_licences(_Methods(adt, "DrivingLicences"), n),
+    "DrivingSchool": lambda adt, n: _fill_school(_Methods(adt, "DrivingSchool"), n),
+    "MusicPlayer": lambda adt, n: _fill_music(_Methods(adt, "MusicPlayer"), n),
+}
+
+
+class _Methods:
+    # Calls the ADT by canonical operation name, both as adt["op"](...) and adt.op(...)
+    def __init__(self, adt, problem):
+        self.adt = adt
+        self.problem = problem
+
+    def __getitem__(self, operation):
+        return getattr(self.adt, find_method(type(self.adt), self.problem, operation))
+
+    __getattr__ = __getitem__
+
+
+def find_method(cls, problem, operation):
+    for name in ALIASES[problem][operation]:
+        if callable(getattr(cls, name, None)):
+            return name
+    return None
+
+
+def _constructible(cls): # cls() needs no arguments, so the checker can build it
+    try:
+        parameters = inspect.signature(cls).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return all(parameter.default is not parameter.empty or parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+               for parameter in parameters)
+
+
+def find_adt(module, problem):
+    # The class defined in the module that implements most of the problem's operations
+    # and can be built without arguments; on a tie, a subclass wins over its base
+    best, best_count = None, 0
+    for _, cls in inspect.getmembers(module, inspect.isclass):
+        if cls.__module__ != module.__name__ or not _constructible(cls):
+            continue
+        count = sum(find_method(cls, problem, operation) is not None for operation in ALIASES[problem])
+        if count > best_count or (count == best_count and count and issubclass(cls, best)):
+            best, best_count = cls, count
+    return best
+
+
+def _terms(text): # the terms of a sum, split on the + outside parentheses
+    terms, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        depth += (char == "(") - (char == ")")
+        if char == "+" and depth == 0:
+            terms.append(text[start:i])
+            start = i + 1
+    return terms + [text[start:]]
+
+
+def _term_order(term):
+    # A log of anything is dropped, then every factor counts the powers of its
+    # single-letter variables, or 1 for a named quantity (len(line), input size)
+    term = re.sub(r"log\s*(\([^()]*\)|\w+)", " ", term)
+    term = re.sub(r"\([^()]*\)", "", term)
+    if not re.search(r"[a-z]", term):
+        return 0 if re.search(r"\d|^\s*$", term) else None
+    order = 0
+    for factor in term.split("*"):
+        variables = re.findall(r"\b[a-z]\b(?:\^(\d+))?", factor)
+        if variables:
+            order += sum(int(power or 1) for power in variables)
+        elif re.search(r"[a-z]", factor):
+            order += 1
+    return order
+
+
+def parse_order(text):
+    # Growth exponent of a Big-O expression, the largest among the terms of a sum:
+    # O(1)/O(16)/O(log n)/O(log 16) -> 0, O(n)/O(k + log n)/O(log m + c)/O(k log m) -> 1,
+    # O(n^2)/O(n*n)/O(n m) -> 2. None if unrecognised.
+    text = text.lower().replace("²", "^2")
+    if not re.search(r"\w", text):
+        return None
+    orders = [_term_order(term) for term in _terms(text)]
+    if None in orders:
+        return None
+    return max(orders)
+
+
+def claimed_order(cls, method_name):
+    # Big-O written on the def line, on the line above it, or in the first body lines
+    method = getattr(cls, method_name)
+    try:
+        lines, first = inspect.getsourcelines(method)
+        module_lines = inspect.getsourcelines(inspect.getmodule(method))[0]
+    except (OSError, TypeError):
+        return None, None
+    above = module_lines[first - 2] if first >= 2 else ""
+    candidates = [lines[0], above] + lines[1:4]
+    for line in candidates:
+        if "#" not in line:
+            continue
+        match = re.search(r"O\(([^)]*(?:\([^)]*\))?[^)]*)\)", line.split("#", 1)[1])
+        if match:
+            return match.group(0), parse_order(match.group(1))
+    return None, None
+
+
+def _time_per_call(cls, problem, n, method_name, call, batch, repeat):
+    adt = cls()
+    FILL[problem](adt, n)
+    method = getattr(adt, method_name)
+    best = float("inf")
+    for r in range(repeat):
+        calls = [call(n, r * batch + j) for j in range(batch)]
+        start = time.perf_counter_ns()
+        for args in calls:
+            method(*args)
+        best = min(best, time.perf_counter_ns() - start)
+    return max(best / batch, 1)
+
+
+def _slope(sizes, times):
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(value) for value in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+            / sum((x - mean_x) ** 2 for x in xs))
+
+
+def check_solution(module, problem, sizes, batch=50, repeat=3, tolerance=0.7):
+    # Yields (operation, method, claimed text, claimed order, measured slope, verdict)
+    cls = find_adt(module, problem)
+    if cls is None:
+        return
+    if batch * repeat > min(sizes) // 4:
+        raise ValueError("the smallest size must be at least 4 * batch * repeat")
+
+    for operation, call in CALLS[problem].items():
+        method_name = find_method(cls, problem, operation)
+        if method_name is None:
+            continue
+        text, order = claimed_order(cls, method_name)
+        try:
+            times = [_time_per_call(cls, problem, n, method_name, call, batch, repeat) for n in sizes]
+        except Exception as e:
+            yield operation, method_name, text, order, None, f"error: {e!r}"
+            continue
+        slope = _slope(sizes, times)
+        if order is None:
+            verdict = "no claim"
+        elif slope > order + tolerance:
+            verdict = "MISMATCH"
+        else:
+            verdict = "ok"
+        yield operation, method_name, text, order, slope, verdict
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check claimed Big-O of ADT methods empirically")
+    parser.add_argument("--filter", help="only solutions whose name contains this text")
+    parser.add_argument("--start", type=int, default=1000, help="smallest state size")
+    parser.add_argument("--sizes", type=int, default=5, help="number of doubling sizes")
+    parser.add_argument("--batch", type=int, default=50, help="calls per timed batch")
+    parser.add_argument("--repeat", type=int, default=3, help="batches per size, the best one counts")
+    parser.add_argument("--tolerance", type=float, default=0.7)
+    args = parser.parse_args()
+    sizes = [args.start * 2 ** i for i in range(args.sizes)]
+
+    mismatches = 0
+    print(f"{'solution':<44} {'method':<20} {'claimed':<18} {'measured':>9}  verdict")
+    for problem, paths in discover_solutions().items():
+        for path in paths:
+            name = solution_name(path)
+            if args.filter and args.filter not in name:
+                continue
+            try:
+                module = load_solution(path)
+            except Exception as e:
+                print(f"{name:<44} import failed: {e!r}")
+                continue
+            with contextlib.redirect_stdout(io.StringIO()) as sink:
+                results = []
+                for result in check_solution(module, problem, sizes, args.batch, args.repeat, args.tolerance):
+                    results.append(result)
+                    sink.seek(0)
+                    sink.truncate()
+            for operation, method_name, text, order, slope, verdict in results:
+                measured = f"n^{slope:.2f}" if slope is not None else "-"
+                print(f"{name:<44} {method_name:<20} {text or '-':<18} {measured:>9}  {verdict}")
+                mismatches += verdict == "MISMATCH"
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import importlib.util
+import re
+import sys
+from pathlib import Path
+
+# A solution belongs to the problem one of whose markers appears in its source: a
+# command, or for licence variants that inherit every command, CORE_COMMANDS
+PROBLEM_MARKERS = {
+    "DrivingLicences": ("cuantos_con_puntos", "CORE_COMMANDS"),
+    "DrivingSchool": ("es_alumno",),
+    "MusicPlayer": ("addToPlaylist",),
+}
+
+# A solution opts out with this line at module level, e.g. when ads_libs.workload
+# cannot drive its commands; it is then only run on its own inputs
+NOT_DISCOVERABLE = re.compile(r"^DISCOVERABLE = False\b", re.MULTILINE)
+
+
+def discover_solutions(root="solutions"):
+    # Returns {problem: [path, ...]} for every .py file under root with a process_operations,
+    # but the ones that set DISCOVERABLE = False
+    found = {problem: [] for problem in PROBLEM_MARKERS}
+    for path in sorted(Path(root).rglob("*.py")):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        if "def process_operations" not in text or NOT_DISCOVERABLE.search(text):
+            continue
+        for problem, markers in PROBLEM_MARKERS.items():
+            if any(marker in text for marker in markers):
+                found[problem].append(path)
+                break
+    return found
+
+
+def solution_name(path, root="solutions"):
+    return Path(path).relative_to(root).with_suffix("").as_posix()
+
+
+def load_solution(path):
+    # Imports a solution file as a module without running its main()
+    if "." not in sys.path:
+        sys.path.append(".")
+    name = "solution_" + "_".join(Path(path).with_suffix("").parts)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module # process pools and pickling resolve functions by module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,166 @@
+from operator import call
+
+# Opcode of the instruction emitted when an argument cannot be converted.
+# It indexes the last handler, which re-raises the stored error at run time
+# so the error is reported in order, exactly where the if/elif chain raised it.
+RAISE = -1
+
+# ads_libs.stats.OperationStats collecting per-command counts and latencies, or None.
+# Set through enable_stats(); run_compiled checks it once per program, so the
+# plain loop below is untouched when instrumentation is off.
+_stats = None
+
+
+def _raise(opcode, error):
+    raise error
+
+
+def _conversions(converters):
+    # Positions (among the arguments) that need converting; str arguments are kept as split
+    return [(i, convert) for i, convert in enumerate(converters) if convert is not str]
+
+
+def compile_operations(operations, commands): # O(p), p is the number of operations
+    # Compiles every line once into (opcode, args) with the arguments already converted.
+    # commands maps each command name to the converters of its arguments, e.g.
+    # {"quitar": (str, int)}; the position of a name in the dict is its opcode.
+    # An optional None entry receives unknown commands (with the command name as
+    # its only argument); without it unknown commands are skipped.
+    opcodes = {}
+    for opcode, (name, converters) in enumerate(commands.items()):
+        entry = (opcode, len(converters) + 1, _conversions(converters))
+        opcodes[name] = entry
+    fallback = opcodes.get(None)
+
+    program = []
+    append = program.append
+    for op in operations:
+        parts = op.split()
+        entry = opcodes.get(parts[0])
+        if entry is None:
+            if fallback is not None:
+                append((fallback[0], (parts[0],)))
+            continue
+        opcode, end, conversions = entry
+        args = parts[1:end]
+        if len(args) != end - 1:
+            raise IndexError(f"missing arguments: {op.strip()}")
+        try:
+            for i, convert in conversions:
+                args[i] = convert(args[i])
+        except ValueError as error:
+            append((RAISE, (opcode, error)))
+            continue
+        append((opcode, tuple(args)))
+
+    return program
+
+
+def _layout(commands):
+    # {name: (arity, first, second and third converters, converters)} of a command
+    # table, computed once per distinct table. Commands take up to three arguments,
+    # which run_operations converts without building a tuple.
+    key = tuple(commands.items())
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = _layouts[key] = {
+            name: (len(converters), *(tuple(converters) + (None, None, None))[:3], tuple(converters))
+            for name, converters in commands.items() if name is not None
+        }
+    return layout
+
+
+_layouts = {}
+
+
+def run_operations(operations, commands, handlers, on_error): # O(p)
+    # compile_operations + run_compiled in a single pass, for operations that are
+    # run once (main() and the runner): every line is split, its command looked up
+    # in a dict of handlers, and its arguments converted and passed straight to the
+    # handler, so no (opcode, args) item or program list is built. Errors are
+    # reported in order as in run_compiled; a line with missing arguments raises
+    # IndexError.
+    if _stats is not None:
+        run_compiled(compile_operations(operations, commands), commands, handlers, on_error)
+        return
+    entries = {name: (handlers[name], name, *layout) for name, layout in _layout(commands).items()}
+    get = entries.get
+    fallback = handlers[None] if None in commands else None
+    for op in operations:
+        parts = op.split()
+        entry = get(parts[0])
+        if entry is None:
+            if fallback is not None:
+                try:
+                    fallback(parts[0])
+                except ValueError as error:
+                    on_error(None, error)
+            continue
+        handler, name, arity, first, second, third, converters = entry
+        try:
+            if arity == 1:
+                handler(first(parts[1]))
+            elif arity == 2:
+                handler(first(parts[1]), second(parts[2]))
+            elif arity == 0:
+                handler()
+            elif arity == 3:
+                handler(first(parts[1]), second(parts[2]), third(parts[3]))
+            else:
+                if len(parts) <= arity:
+                    raise IndexError(f"missing arguments: {op.strip()}")
+                handler(*map(call, converters, parts[1:arity + 1]))
+        except ValueError as error:
+            on_error(name, error)
+
+
+def enable_stats(stats=None):
+    # Instruments every following run_compiled call; returns the stats being filled
+    global _stats
+    if stats is None:
+        from ads_libs.stats import OperationStats
+        stats = OperationStats()
+    _stats = stats
+    return stats
+
+
+def disable_stats():
+    global _stats
+    _stats = None
+
+
+def _run_instrumented(program, names, table, on_error, stats):
+    # Same loop as run_compiled, timing every operation. The fallback command is
+    # recorded as "<unknown>"; errors include the ones raised by RAISE instructions.
+    from time import perf_counter_ns as clock
+    record = stats.record
+    labels = tuple("<unknown>" if name is None else name for name in names)
+    for opcode, args in program:
+        start = clock()
+        try:
+            table[opcode](*args)
+            failed = False
+        except ValueError as error:
+            if opcode == RAISE:
+                opcode = args[0]
+            on_error(names[opcode], error)
+            failed = True
+        record(labels[opcode], clock() - start, failed)
+
+
+def run_compiled(program, commands, handlers, on_error): # O(p)
+    # Runs a compiled program in a tight loop over the handlers (bound methods or
+    # closures) given for each command name. on_error(name, error) is called for
+    # every ValueError raised by a handler.
+    names = tuple(commands)
+    table = tuple(handlers[name] for name in names) + (_raise,)
+    if _stats is not None:
+        _run_instrumented(program, names, table, on_error, _stats)
+        return
+    for opcode, args in program:
+        try:
+            table[opcode](*args)
+        except ValueError as error:
+            if opcode == RAISE:
+                opcode = args[0]
+            on_error(names[opcode], error)
@@ -0,0 +1,29 @@
+class FenwickTree:
+    # Binary indexed tree over positions 0..size-1: point updates and prefix sums
+    # in O(log size). Ranges are half-open, like Python slices.
+    def __init__(self, size):
+        self.tree = [0] * (size + 1)  # 1-based internally
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def add(self, position, delta): # O(log size)
+        i = position + 1
+        tree = self.tree
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def prefix_sum(self, end): # O(log size), sum of positions [0, end)
+        total = 0
+        tree = self.tree
+        i = end
+        while i > 0:
+            total += tree[i]
+            i -= i & -i
+        return total
+
+    def range_sum(self, start, end): # O(log size), sum of positions [start, end)
+        if end <= start:
+            return 0
+        return self.prefix_sum(end) - self.prefix_sum(start)
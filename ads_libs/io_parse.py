@@ -1,10 +1,95 @@
+import io
+import mmap
+import os
+import re
 import sys
 
+# A line made only of spaces, \t, \r, \v and \f, between two newlines
+_BLANK_LINE = re.compile(rb"\n[ \t\r\x0b\x0c]*\n")
+
 
 def convert_file_to_commands(filename):
     with open(filename, 'r') as file:
         return [line.strip() for line in file.readlines() if line.strip()]
-    
+
+
+def read_test_cases(filename):
+    # Streams the file one line at a time and yields each FIN-delimited test case
+    # as a list of stripped commands, so memory is bounded by the largest test case
+    # instead of the whole file. Empty test cases and trailing lines without FIN
+    # are skipped, as in the original main() loops.
+    with open(filename, 'r') as file:
+        test_case = []
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            if line == "FIN":
+                if test_case:
+                    yield test_case
+                    test_case = []
+            else:
+                test_case.append(line)
+
+
+class RawTestCase:
+    # One FIN-delimited test case of read_test_cases_mmap: the bytes of its lines,
+    # blank lines removed. Iterating it reads the lines through a text layer over
+    # those bytes, which decodes a chunk at a time, so no list of lines is ever
+    # built. Lines keep their newline and surrounding whitespace, which op.split()
+    # ignores. It can be iterated again and pickled.
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __iter__(self):
+        return io.TextIOWrapper(io.BytesIO(self.data), encoding="utf-8")
+
+
+def _case_bounds(buffer): # yields (start, end) of the lines of every test case, FIN excluded
+    # Only the occurrences of b"FIN" are looked at from Python; everything else is a
+    # bytes search done in C
+    size = len(buffer)
+    start = pos = 0
+    while True:
+        fin = buffer.find(b"FIN", pos)
+        if fin == -1:
+            return
+        line_start = buffer.rfind(b"\n", 0, fin) + 1
+        line_end = buffer.find(b"\n", fin)
+        if line_end == -1:
+            line_end = size
+        pos = fin + 3
+        if buffer[line_start:line_end].strip() == b"FIN":
+            yield start, line_start
+            start = pos = line_end + 1
+
+
+def read_test_cases_mmap(filename):
+    # Same test cases as read_test_cases, from a memory-mapped file: FIN lines are
+    # found on the raw bytes and each test case is copied out of the mapping as a
+    # single bytes object (a RawTestCase) instead of one stripped str per line.
+    # The pages of a test case are dropped from the mapping once it is copied, so
+    # the process never keeps the whole file resident.
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            released = 0
+            for start, end in _case_bounds(buffer):
+                data = buffer[start:end]
+                if hasattr(mmap, "MADV_DONTNEED") and end - released >= mmap.PAGESIZE:
+                    length = (end - released) // mmap.PAGESIZE * mmap.PAGESIZE
+                    buffer.madvise(mmap.MADV_DONTNEED, released, length)
+                    released += length
+                if data.isspace() or not data:
+                    continue
+                if data[:1].isspace() or _BLANK_LINE.search(data):
+                    data = b"".join(line for line in data.splitlines(True) if not line.isspace())
+                yield RawTestCase(data)
+
+
 def process_operations(test_case):
     return NotImplemented
 
@@ -13,20 +98,12 @@ def main():
        raise Exception("Usage: python script.py <input_file>")
 
     input_file = sys.argv[1]
-    operations = convert_file_to_commands(input_file)
-    
-    test_case = []
 
-    for line in operations:
-        if line == "FIN":
-            if test_case:
-                print("\n".join(process_operations(test_case)))
-                print("---")
-                test_case = []
-        else:
-            test_case.append(line)
+    for test_case in read_test_cases(input_file):
+        print("\n".join(process_operations(test_case)))
+        print("---")
 
 
 if __name__ == "__main__":
 
-    main()
\ No newline at end of file
+    main()
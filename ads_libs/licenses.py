@@ -0,0 +1,35 @@
+from ads_libs.dispatch import run_compiled
+
+
+def process_program(system, program, commands, execute=run_compiled, handlers=None, output=None): # O(p), p is the number of operations
+    # Output of a DrivingLicences program (compiled by ads_libs.dispatch, or operations
+    # with execute=run_operations) run on system, any LicenseSystem-like ADT: nuevo and
+    # quitar go straight to it, consultar and cuantos_con_puntos print their answer
+    # and every error prints "ERROR: <message>". handlers adds the handlers of extra
+    # commands, or replaces core ones, by name; they append their lines to output,
+    # which is the list returned.
+    if output is None:
+        output = []
+
+    def consultar(dni):
+        points = system.consultar(dni)
+        output.append(f"Puntos de {dni}: {points}")
+
+    def cuantos_con_puntos(puntos):
+        count = system.cuantos_con_puntos(puntos)
+        output.append(f"Con {puntos} puntos hay {count}")
+
+    def error(command, e):
+        output.append(f"ERROR: {e}")
+
+    table = {
+        "nuevo": system.nuevo,
+        "quitar": system.quitar,
+        "consultar": consultar,
+        "cuantos_con_puntos": cuantos_con_puntos,
+    }
+    if handlers:
+        table.update(handlers)
+    execute(program, commands, table, error)
+
+    return output
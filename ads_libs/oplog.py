@@ -0,0 +1,258 @@
+"""Compact binary op-log: compile text inputs once, replay them many times.
+
+Usage (from the repository root):
+    python -m ads_libs.oplog compile <solution_module> <input_file> <oplog_file>
+    python -m ads_libs.oplog replay <solution_module> <oplog_file> [--repeat N] [--interned]
+
+<solution_module> is a dotted module that defines COMMANDS and process_program,
+e.g. solutions.teacher.driving_licenses. With --interned, identifiers are handed to
+process_program(program, table=table) as ids of an ads_libs.interning.InternTable
+instead of strings; only solutions whose process_program has a table parameter
+support it (solutions/teacher/driving_licenses_indexed.py).
+
+File layout. Test cases are stored column by column, so replay decodes them in bulk
+(array.frombytes, str.split, zip) instead of one field at a time:
+    header     MAGIC, number of commands, then per command: name, argument types
+               ("s" for identifiers, "i" for integers). The fallback command (None)
+               is stored with an empty name. Header integers are LEB128 varints.
+    test case  number of records (varint), then one byte per record:
+                 1..254   command opcode + 1
+                 255      argument conversion error
+               new identifiers: count and byte length (varints), then the utf-8
+               identifiers seen for the first time in this test case, joined by
+               newlines. Identifiers get dense ids in order of first appearance.
+               For every command that has records, in opcode order, one column
+               per argument with its value in each record: the identifier id or
+               the integer.
+               If there are errors: a column with the opcode of each, then their
+               messages joined by newlines (varint byte length + utf-8).
+    column     one byte for its encoding, then the values: 0 for little-endian
+               int64, 1 for zigzag varints when some value does not fit in 64 bits
+               (e.g. quitar A 99999999999999999999).
+"""
+import argparse
+import importlib
+import inspect
+import mmap
+import os
+import sys
+from array import array
+from itertools import repeat
+
+from ads_libs.codec import read_bytes, read_varint, unzigzag, write_bytes, write_varint, zigzag
+from ads_libs.dispatch import RAISE, compile_operations
+from ads_libs.interning import InternTable
+from ads_libs.io_parse import read_test_cases
+
+MAGIC = b"ADSOPLOG3\n"
+ERROR = 255
+INT64, VARINT = range(2)  # column encodings
+_FLUSH_SIZE = 1 << 20
+
+
+def _signature(commands):
+    # (name, types) per opcode; the fallback receives the unknown command's name
+    signature = []
+    for name, converters in commands.items():
+        if name is None:
+            signature.append(("", "s"))
+            continue
+        types = ""
+        for convert in converters:
+            if convert is int:
+                types += "i"
+            elif convert is str:
+                types += "s"
+            else:
+                raise ValueError(f"Cannot encode arguments converted by {convert!r}")
+        signature.append((name, types))
+    if len(signature) > ERROR - 1:
+        raise ValueError("Too many commands for a one-byte opcode")
+    return signature
+
+
+def _column(values): # little-endian int64 column, or zigzag varints if a value does not fit
+    try:
+        column = array("q", values)
+    except OverflowError:
+        out = bytearray((VARINT,))
+        for value in values:
+            write_varint(out, zigzag(value))
+        return out
+    if sys.byteorder == "big":
+        column.byteswap()
+    return bytes((INT64,)) + column.tobytes()
+
+
+def _read_column(data, pos, count): # (list of count integers, new pos)
+    encoding = data[pos]
+    pos += 1
+    if encoding == VARINT:
+        values = []
+        for _ in range(count):
+            value, pos = read_varint(data, pos)
+            values.append(unzigzag(value))
+        return values, pos
+    column = array("q")
+    column.frombytes(data[pos:pos + 8 * count])
+    if sys.byteorder == "big":
+        column.byteswap()
+    return column.tolist(), pos + 8 * count
+
+
+def compile_log(test_cases, commands, output_file): # O(total input size)
+    # Writes the FIN-delimited test cases (lists of lines) as a binary op-log
+    signature = _signature(commands)
+    ids = InternTable()
+    out = bytearray(MAGIC)
+    write_varint(out, len(signature))
+    for name, types in signature:
+        write_bytes(out, name.encode())
+        write_bytes(out, types.encode())
+
+    with open(output_file, "wb") as file:
+        for test_case in test_cases:
+            records = bytearray()
+            columns = [[[] for _ in types] for _, types in signature]
+            errors, messages = [], []
+            new = []
+            for opcode, args in compile_operations(test_case, commands):
+                if opcode == RAISE:
+                    records.append(ERROR)
+                    errors.append(args[0])
+                    messages.append(str(args[1]))
+                    continue
+                records.append(opcode + 1)
+                for kind, arg, column in zip(signature[opcode][1], args, columns[opcode]):
+                    if kind == "s":
+                        known = len(ids)
+                        key, arg = arg, ids.intern(arg)
+                        if arg == known:
+                            new.append(key)
+                    column.append(arg)
+
+            write_varint(out, len(records))
+            out += records
+            strings = "\n".join(new).encode()
+            write_varint(out, len(new))
+            write_bytes(out, strings)
+            for opcode_columns in columns:
+                for column in opcode_columns:
+                    if column: # a command without records has no columns
+                        out += _column(column)
+            if errors:
+                out += _column(errors)
+                write_bytes(out, "\n".join(messages).encode())
+            if len(out) >= _FLUSH_SIZE:
+                file.write(out)
+                out.clear()
+        file.write(out)
+
+
+def replay_log(filename, commands=None, table=None): # O(file size)
+    # Yields one compiled program per test case, ready for process_program. Each
+    # program is a one-shot iterator over (opcode, args); wrap it in list() to keep it.
+    # If commands is given, the log must have been compiled with the same table.
+    # If an InternTable is given, identifiers are yielded as their ids in it
+    # (ids in the log are dense, so they match the table's ids as long as the
+    # table starts empty) and the strings are only stored in the table.
+    if table is not None and len(table):
+        raise ValueError("replay_log needs an empty InternTable")
+    with open(filename, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise ValueError(f"{filename} is not an op-log")
+        data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError(f"{filename} is not an op-log")
+    pos = len(MAGIC)
+    count, pos = read_varint(data, pos)
+    signature = []
+    for _ in range(count):
+        name, pos = read_bytes(data, pos)
+        types, pos = read_bytes(data, pos)
+        signature.append((name.decode(), types.decode()))
+    if commands is not None and signature != _signature(commands):
+        raise ValueError(f"{filename} was compiled for other commands: {signature}")
+
+    # Opcode of each record byte, for map(); errors become RAISE instructions
+    opcodes = list(range(-1, len(signature))) + [0] * (ERROR - len(signature) - 1) + [RAISE]
+    view = memoryview(data)
+    interned = table is not None
+    strings = [] # id -> identifier, when not interned
+    size = len(data)
+    while pos < size:
+        count, pos = read_varint(view, pos)
+        records = bytes(view[pos:pos + count])
+        pos += count
+        new, pos = read_varint(view, pos)
+        text, pos = read_bytes(view, pos)
+        if new:
+            text = str(text, "utf-8").split("\n")
+            if interned:
+                for key in text:
+                    table.intern(key)
+            else:
+                strings += text
+
+        # One iterator of argument tuples per record byte, zipped from the columns
+        streams = [None] * (ERROR + 1)
+        for record, (_, types) in enumerate(signature, 1):
+            count = records.count(record)
+            if not count:
+                continue
+            columns = []
+            for kind in types:
+                column, pos = _read_column(view, pos, count)
+                if kind == "s" and not interned:
+                    column = map(strings.__getitem__, column)
+                columns.append(column)
+            streams[record] = zip(*columns) if columns else repeat(())
+        count = records.count(ERROR)
+        if count:
+            column, pos = _read_column(view, pos, count)
+            messages, pos = read_bytes(view, pos)
+            streams[ERROR] = zip(column, map(ValueError, str(messages, "utf-8").split("\n")))
+
+        # The program is an iterator, so the (opcode, args) pairs zip builds are
+        # reused as run_compiled consumes them instead of being allocated and kept
+        yield zip(map(opcodes.__getitem__, records), map(next, map(streams.__getitem__, records)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile and replay binary op-logs")
+    actions = parser.add_subparsers(dest="action", required=True)
+    compile_parser = actions.add_parser("compile", help="compile a text input into an op-log")
+    compile_parser.add_argument("solution")
+    compile_parser.add_argument("input_file")
+    compile_parser.add_argument("oplog_file")
+    replay_parser = actions.add_parser("replay", help="run a solution over an op-log")
+    replay_parser.add_argument("solution")
+    replay_parser.add_argument("oplog_file")
+    replay_parser.add_argument("--repeat", type=int, default=1,
+                               help="replay N times, printing the output of the last run")
+    replay_parser.add_argument("--interned", action="store_true",
+                               help="pass identifiers as InternTable ids to process_program")
+    args = parser.parse_args()
+
+    sys.path.append(".")
+    solution = importlib.import_module(args.solution)
+
+    if args.action == "compile":
+        compile_log(read_test_cases(args.input_file), solution.COMMANDS, args.oplog_file)
+        return
+    if args.interned and "table" not in inspect.signature(solution.process_program).parameters:
+        parser.error(f"{args.solution}.process_program has no table parameter, so it cannot replay --interned")
+
+    for run in range(args.repeat):
+        last = run == args.repeat - 1
+        table = InternTable() if args.interned else None
+        for program in replay_log(args.oplog_file, solution.COMMANDS, table):
+            output = solution.process_program(program, table=table) if args.interned else solution.process_program(program)
+            if last:
+                print("\n".join(output))
+                print("---")
+
+
+if __name__ == "__main__":
+    main()
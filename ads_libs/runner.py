@@ -0,0 +1,102 @@
+import argparse
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from ads_libs import dispatch
+from ads_libs.io_parse import read_test_cases, read_test_cases_mmap
+from ads_libs.stats import OperationStats
+
+
+def _chunks(test_cases, size):
+    chunk = []
+    for test_case in test_cases:
+        chunk.append(test_case)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _process_chunk(process_operations, chunk, collect_stats=False):
+    # Runs in a worker process; process_operations is pickled by reference.
+    # With collect_stats the chunk's operation stats are sent back along with the outputs.
+    if not collect_stats:
+        return [process_operations(test_case) for test_case in chunk]
+    stats = dispatch.enable_stats(OperationStats())
+    try:
+        return [process_operations(test_case) for test_case in chunk], stats.to_dict()
+    finally:
+        dispatch.disable_stats()
+
+
+def run_test_cases(process_operations, test_cases, workers=1, chunk_size=64, stats=None):
+    # Yields the output of every test case in input order.
+    # Test cases share no state (each one builds a fresh ADT), so with workers > 1
+    # they are sent to a process pool in chunks. At most 2 * workers chunks are in
+    # flight, which keeps memory bounded while the input is streamed.
+    # If an OperationStats is given, every operation run through ads_libs.dispatch
+    # is recorded in it (the workers' stats are merged as their chunks come back).
+    if workers <= 1:
+        if stats is not None:
+            dispatch.enable_stats(stats)
+        try:
+            for test_case in test_cases:
+                yield process_operations(test_case)
+        finally:
+            if stats is not None:
+                dispatch.disable_stats()
+        return
+
+    collect_stats = stats is not None
+
+    def results(future):
+        if not collect_stats:
+            return future.result()
+        outputs, chunk_stats = future.result()
+        stats.merge(OperationStats.from_dict(chunk_stats))
+        return outputs
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in _chunks(test_cases, chunk_size):
+            pending.append(pool.submit(_process_chunk, process_operations, chunk, collect_stats))
+            if len(pending) >= 2 * workers:
+                yield from results(pending.popleft())
+        while pending:
+            yield from results(pending.popleft())
+
+
+def run(process_operations, argv=None):
+    # Shared main(): python script.py <input_file> [--workers N] [--chunk-size C] [--mmap] [--stats [PATH]]
+    parser = argparse.ArgumentParser(description="Run every FIN-delimited test case of an input file")
+    parser.add_argument("input_file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of worker processes (default: 1, serial)")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="test cases sent to a worker at a time")
+    parser.add_argument("--mmap", action="store_true",
+                        help="read the input through read_test_cases_mmap")
+    parser.add_argument("--stats", nargs="?", const="-", metavar="PATH",
+                        help="record per-command counts, errors and latency histograms; "
+                             "the report goes to stderr, or as JSON to PATH")
+    args = parser.parse_args(argv)
+
+    if args.workers < 1 or args.chunk_size < 1:
+        parser.error("--workers and --chunk-size must be positive")
+
+    reader = read_test_cases_mmap if args.mmap else read_test_cases
+    test_cases = reader(args.input_file)
+
+    stats = OperationStats() if args.stats else None
+    for output in run_test_cases(process_operations, test_cases, args.workers, args.chunk_size, stats):
+        print("\n".join(output))
+        print("---")
+
+    if stats is None:
+        return
+    if args.stats == "-":
+        print(stats.format(), file=sys.stderr)
+    else:
+        stats.write_json(args.stats)
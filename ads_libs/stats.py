@@ -0,0 +1,139 @@
+import json
+
+
+def _bucket(value):
+    # Log-linear buckets as in HDR histograms: exact below 32, then 16 buckets per
+    # power of two, i.e. at most ~6% relative error whatever the magnitude
+    if value < 32:
+        return value
+    shift = value.bit_length() - 5
+    return (shift << 4) + (value >> shift)
+
+
+def _bucket_bounds(index):
+    if index < 32:
+        return index, index
+    shift = (index >> 4) - 1
+    low = ((index & 15) + 16) << shift
+    return low, low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = []
+        self.total = 0
+        self.sum = 0
+        self.max = 0
+
+    def record(self, value): # O(1) amortized
+        index = _bucket(value)
+        if index >= len(self.counts):
+            self.counts.extend([0] * (index + 1 - len(self.counts)))
+        self.counts[index] += 1
+        self.total += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        if len(other.counts) > len(self.counts):
+            self.counts.extend([0] * (len(other.counts) - len(self.counts)))
+        for index, count in enumerate(other.counts):
+            self.counts[index] += count
+        self.total += other.total
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def percentile(self, fraction): # O(buckets), upper bound of the bucket holding the percentile
+        if not self.total:
+            return 0
+        rank = max(1, round(fraction * self.total))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min(_bucket_bounds(index)[1], self.max)
+        return self.max
+
+    def to_dict(self):
+        return {"counts": self.counts, "total": self.total, "sum": self.sum, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = list(data["counts"])
+        histogram.total, histogram.sum, histogram.max = data["total"], data["sum"], data["max"]
+        return histogram
+
+
+class OperationStats:
+    # Call count, error count and latency histogram (in ns) per command name
+    def __init__(self):
+        self.calls = {}
+        self.errors = {}
+        self.latency = {}
+
+    def record(self, command, elapsed, error):
+        histogram = self.latency.get(command)
+        if histogram is None:
+            histogram = self.latency[command] = LatencyHistogram()
+            self.calls[command] = self.errors[command] = 0
+        histogram.record(elapsed)
+        self.calls[command] += 1
+        if error:
+            self.errors[command] += 1
+
+    def merge(self, other):
+        for command, histogram in other.latency.items():
+            if command not in self.latency:
+                self.latency[command] = LatencyHistogram()
+                self.calls[command] = self.errors[command] = 0
+            self.latency[command].merge(histogram)
+            self.calls[command] += other.calls[command]
+            self.errors[command] += other.errors[command]
+
+    def to_dict(self):
+        return {str(command): {"calls": self.calls[command], "errors": self.errors[command],
+                               "latency_ns": histogram.to_dict()}
+                for command, histogram in self.latency.items()}
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        for command, entry in data.items():
+            stats.calls[command] = entry["calls"]
+            stats.errors[command] = entry["errors"]
+            stats.latency[command] = LatencyHistogram.from_dict(entry["latency_ns"])
+        return stats
+
+    def summary(self):
+        # One row per command, slowest total time first
+        rows = []
+        for command, histogram in self.latency.items():
+            rows.append({
+                "command": str(command),
+                "calls": self.calls[command],
+                "errors": self.errors[command],
+                "total_ms": histogram.sum / 1e6,
+                "mean_us": histogram.sum / histogram.total / 1e3,
+                "p50_us": histogram.percentile(0.50) / 1e3,
+                "p90_us": histogram.percentile(0.90) / 1e3,
+                "p99_us": histogram.percentile(0.99) / 1e3,
+                "max_us": histogram.max / 1e3,
+            })
+        return sorted(rows, key=lambda row: -row["total_ms"])
+
+    def format(self):
+        if not self.latency:
+            return "No instrumented operations (the solution does not use ads_libs.dispatch)"
+        lines = [f"{'command':<20} {'calls':>10} {'errors':>8} {'total ms':>10} {'mean us':>9} "
+                 f"{'p50 us':>9} {'p90 us':>9} {'p99 us':>9} {'max us':>9}"]
+        for row in self.summary():
+            lines.append(f"{row['command']:<20} {row['calls']:>10} {row['errors']:>8} {row['total_ms']:>10.2f} "
+                         f"{row['mean_us']:>9.2f} {row['p50_us']:>9.2f} {row['p90_us']:>9.2f} "
+                         f"{row['p99_us']:>9.2f} {row['max_us']:>9.2f}")
+        return "\n".join(lines)
+
+    def write_json(self, filename):
+        with open(filename, "w") as file:
+            json.dump({"summary": self.summary(), "histograms": self.to_dict()}, file, indent=2)
@@ -0,0 +1,193 @@
+import random
+
+
+class _Node:
+    __slots__ = ("key", "value", "priority", "left", "right", "size", "top")
+
+    def __init__(self, key, value, priority):
+        self.key = key
+        self.value = value
+        self.priority = priority
+        self.left = None
+        self.right = None
+        self.size = 1
+        self.top = value  # largest value in the subtree
+
+
+def _update(node):
+    size, top = 1, node.value
+    left, right = node.left, node.right
+    if left is not None:
+        size += left.size
+        if left.top > top:
+            top = left.top
+    if right is not None:
+        size += right.size
+        if right.top > top:
+            top = right.top
+    node.size, node.top = size, top
+
+
+def _split(node, key): # (keys < key, keys >= key)
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        _update(node)
+        return node, right
+    left, node.left = _split(node.left, key)
+    _update(node)
+    return left, node
+
+
+def _merge(left, right): # every key of left is smaller than every key of right
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        _update(left)
+        return left
+    right.left = _merge(left, right.left)
+    _update(right)
+    return right
+
+
+def _insert(node, new):
+    if node is None:
+        return new
+    if new.priority > node.priority:
+        new.left, new.right = _split(node, new.key)
+        _update(new)
+        return new
+    if new.key < node.key:
+        node.left = _insert(node.left, new)
+    else:
+        node.right = _insert(node.right, new)
+    _update(node)
+    return node
+
+
+def _remove(node, key):
+    if node.key == key:
+        return _merge(node.left, node.right)
+    if key < node.key:
+        node.left = _remove(node.left, key)
+    else:
+        node.right = _remove(node.right, key)
+    _update(node)
+    return node
+
+
+class Treap:
+    # Ordered map (randomized balanced BST) with two augmentations per subtree:
+    # its size, for rank and select, and its largest value, so the keys whose
+    # value is at least a threshold can be listed in key order while skipping
+    # every subtree whose largest value is below it. Values must be comparable.
+    # All operations are O(log n) expected unless stated otherwise.
+    def __init__(self, seed=None):
+        self.root = None
+        self.random = random.Random(seed).random
+
+    def __len__(self):
+        return self.root.size if self.root is not None else 0
+
+    def _find(self, key):
+        node = self.root
+        while node is not None and node.key != key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def get(self, key, default=None):
+        node = self._find(key)
+        return node.value if node is not None else default
+
+    def insert(self, key, value): # the key must not be in the treap
+        self.root = _insert(self.root, _Node(key, value, self.random()))
+
+    def remove(self, key): # the key must be in the treap
+        self.root = _remove(self.root, key)
+
+    def set_value(self, key, value): # the key must be in the treap
+        path = []
+        node = self.root
+        while node.key != key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        node.value = value
+        _update(node)
+        for node in reversed(path):
+            _update(node)
+
+    def at_least(self, threshold): # O(k log n) for the k keys returned, in key order
+        # Keys whose value is >= threshold
+        keys = []
+        stack = []
+        node = self.root
+        while True:
+            while node is not None and node.top >= threshold:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                return keys
+            node = stack.pop()
+            if node.value >= threshold:
+                keys.append(node.key)
+            node = node.right
+
+    def first(self, k): # O(k + log n), the k smallest keys in order
+        keys = []
+        stack = []
+        node = self.root
+        while len(keys) < k:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            if not stack:
+                break
+            node = stack.pop()
+            keys.append(node.key)
+            node = node.right
+        return keys
+
+    def rank(self, key): # number of keys smaller than key
+        smaller = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                smaller += 1 + (node.left.size if node.left is not None else 0)
+                node = node.right
+            else:
+                node = node.left
+        return smaller
+
+    def select(self, index): # the key with `index` smaller keys
+        if not 0 <= index < len(self):
+            raise IndexError("treap index out of range")
+        node = self.root
+        while True:
+            left = node.left.size if node.left is not None else 0
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.key
+            else:
+                index -= left + 1
+                node = node.right
+
+    def items(self): # O(n), in key order
+        items = []
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            items.append((node.key, node.value))
+            node = node.right
+        return items
@@ -0,0 +1,257 @@
+"""Synthetic, reproducible operation streams for the three problems.
+
+Usage (from the repository root):
+    python -m ads_libs.workload DrivingLicences --ops 1e6 --cases 10 -o licences.txt
+    python -m ads_libs.workload MusicPlayer --ops 1e5 --distribution zipf --zipf-s 1.2 \\
+        --mix addSong=1,addToPlaylist=3,play=3,recent=1 --error-rate 0.1 --seed 7
+
+Each test case starts from an empty ADT and ends with FIN, like problems/*/input*.
+Keys (DNIs, students, instructors, songs) are drawn from a fixed universe with a
+uniform or Zipf popularity. --error-rate is the probability that an operation that
+can fail is generated so that it fails (duplicate or unknown key, invalid points...).
+"""
+import argparse
+import random
+import sys
+from itertools import islice
+
+DEFAULT_MIX = {
+    "DrivingLicences": {"nuevo": 2, "quitar": 4, "consultar": 3, "cuantos_con_puntos": 1},
+    "DrivingSchool": {"alta": 3, "es_alumno": 1, "puntuacion": 2, "actualizar": 3, "examen": 1, "aprobar": 1},
+    "MusicPlayer": {"addSong": 2, "addToPlaylist": 3, "current": 1, "play": 3, "totalTime": 1,
+                    "recent": 1, "deleteSong": 1},
+}
+
+
+class KeyPicker:
+    # Draws ranks 0..n-1 with uniform or Zipf(s) popularity (rank 0 is the most popular).
+    # Zipf uses the inverse of the continuous CDF, so it is O(1) time and memory for any n.
+    def __init__(self, rng, n, distribution="uniform", s=1.1):
+        if distribution not in ("uniform", "zipf"):
+            raise ValueError(f"Unknown distribution {distribution}")
+        self.rng = rng
+        self.n = n
+        self.zipf = distribution == "zipf"
+        self.s = s
+        self.span = n ** (1 - s) - 1 if s != 1 else 0
+
+    def pick(self):
+        if not self.zipf:
+            return self.rng.randrange(self.n)
+        u = self.rng.random()
+        if self.s == 1:
+            x = self.n ** u
+        else:
+            x = (1 + u * self.span) ** (1 / (1 - self.s))
+        return min(int(x) - 1, self.n - 1)
+
+
+class KeySet:
+    # Set of live keys with O(1) add, remove and uniform random choice
+    def __init__(self):
+        self.items = []
+        self.positions = {}
+
+    def __contains__(self, key):
+        return key in self.positions
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, key):
+        if key not in self.positions:
+            self.positions[key] = len(self.items)
+            self.items.append(key)
+
+    def remove(self, key):
+        position = self.positions.pop(key)
+        last = self.items.pop()
+        if position < len(self.items):
+            self.items[position] = last
+            self.positions[last] = position
+
+    def choice(self, rng):
+        return self.items[rng.randrange(len(self.items))]
+
+
+def _live(picker, keys, live, rng, tries=4):
+    # A popular key that is currently live, or any live key if the draws keep missing
+    for _ in range(tries):
+        key = keys(picker.pick())
+        if key in live:
+            return key
+    return live.choice(rng)
+
+
+def _fresh(picker, keys, live, fallback, tries=4):
+    # A popular key that is not live yet; fallback() makes one past the universe
+    for _ in range(tries):
+        key = keys(picker.pick())
+        if key not in live:
+            return key
+    return fallback()
+
+
+def _licences(rng, commands, picker, error_rate):
+    drivers = KeySet()
+    overflow = iter(range(picker.n, sys.maxsize))
+    dni = "{:08d}D".format
+
+    for command in commands:
+        fail = rng.random() < error_rate
+        if command != "cuantos_con_puntos" and not drivers:
+            command, fail = "nuevo", False
+        if command == "nuevo":
+            if fail:
+                yield f"nuevo {drivers.choice(rng)}"
+            else:
+                key = _fresh(picker, dni, drivers, lambda: dni(next(overflow)))
+                drivers.add(key)
+                yield f"nuevo {key}"
+        elif command in ("quitar", "consultar"):
+            key = f"X{rng.randrange(picker.n)}" if fail else _live(picker, dni, drivers, rng)
+            yield f"quitar {key} {rng.randint(1, 6)}" if command == "quitar" else f"consultar {key}"
+        elif command == "cuantos_con_puntos":
+            yield f"cuantos_con_puntos {rng.randint(16, 20) if fail else rng.randint(0, 15)}"
+
+
+def _school(rng, commands, picker, error_rate):
+    students = KeySet()
+    instructors = KeyPicker(rng, max(picker.n // 50, 1), "zipf" if picker.zipf else "uniform", picker.s)
+    student = "A{}".format
+    instructor = "P{}".format
+
+    for command in commands:
+        fail = rng.random() < error_rate
+        if command in ("puntuacion", "actualizar", "aprobar", "es_alumno") and not students and not fail:
+            command = "alta"
+        if command == "alta":
+            key = student(picker.pick())
+            students.add(key)
+            yield f"alta {key} {instructor(instructors.pick())}"
+        elif command == "es_alumno":
+            key = student(picker.pick()) if fail or not students else _live(picker, student, students, rng)
+            yield f"es_alumno {key} {instructor(instructors.pick())}"
+        elif command == "examen":
+            yield f"examen {instructor(instructors.pick())} {rng.randint(0, 30)}"
+        else:
+            key = f"X{rng.randrange(picker.n)}" if fail else _live(picker, student, students, rng)
+            if command == "puntuacion":
+                yield f"puntuacion {key}"
+            elif command == "actualizar":
+                yield f"actualizar {key} {rng.randint(1, 10)}"
+            else:
+                if not fail:
+                    students.remove(key)
+                yield f"aprobar {key}"
+
+
+def _music(rng, commands, picker, error_rate):
+    songs = KeySet()
+    overflow = iter(range(picker.n, sys.maxsize))
+    song = "S{}".format
+
+    for command in commands:
+        fail = rng.random() < error_rate
+        if command in ("addToPlaylist", "deleteSong") and not songs and not fail:
+            command = "addSong"
+        if command == "addSong":
+            if fail and songs:
+                key = songs.choice(rng)
+            else:
+                key = _fresh(picker, song, songs, lambda: song(next(overflow)))
+                songs.add(key)
+            yield f"addSong {key} Artist{rng.randrange(100)} {rng.randint(60, 600)}"
+        elif command == "addToPlaylist":
+            key = f"X{rng.randrange(picker.n)}" if fail else _live(picker, song, songs, rng)
+            yield f"addToPlaylist {key}"
+        elif command == "deleteSong":
+            if fail:
+                yield f"deleteSong X{rng.randrange(picker.n)}"
+            else:
+                key = _live(picker, song, songs, rng)
+                songs.remove(key)
+                yield f"deleteSong {key}"
+        elif command == "recent":
+            yield f"recent {0 if fail else rng.randint(1, 10)}"
+        else:
+            yield command
+
+
+GENERATORS = {
+    "DrivingLicences": _licences,
+    "DrivingSchool": _school,
+    "MusicPlayer": _music,
+}
+
+
+def _commands(rng, mix, count, batch=4096):
+    names, weights = list(mix), list(mix.values())
+    while count > 0:
+        size = min(batch, count)
+        yield from rng.choices(names, weights, k=size)
+        count -= size
+
+
+def generate(problem, ops, cases=1, mix=None, distribution="uniform", zipf_s=1.1,
+             keys=None, error_rate=0.05, seed=0): # O(ops)
+    # Yields the lines of a workload: `ops` operations split over `cases` test cases,
+    # each one closed by FIN. keys is the size of the key universe of a test case
+    # (default: a quarter of its operations).
+    if problem not in GENERATORS:
+        raise ValueError(f"Unknown problem {problem}, expected one of {', '.join(GENERATORS)}")
+    mix = mix or DEFAULT_MIX[problem]
+    unknown = set(mix) - set(DEFAULT_MIX[problem])
+    if unknown:
+        raise ValueError(f"Unknown commands for {problem}: {', '.join(sorted(unknown))}")
+
+    rng = random.Random(seed)
+    for case in range(cases):
+        size = ops // cases + (1 if case < ops % cases else 0)
+        picker = KeyPicker(rng, keys or max(size // 4, 1), distribution, zipf_s)
+        lines = GENERATORS[problem](rng, _commands(rng, mix, size), picker, error_rate)
+        yield from islice(lines, size)
+        yield "FIN"
+
+
+def write_workload(filename, problem, ops, **options):
+    with open(filename, "w") as file:
+        for line in generate(problem, ops, **options):
+            file.write(line)
+            file.write("\n")
+
+
+def _parse_mix(text):
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        mix[name.strip()] = float(weight) if weight else 1.0
+    return mix
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic workload")
+    parser.add_argument("problem", choices=list(GENERATORS))
+    parser.add_argument("--ops", type=lambda text: int(float(text)), default=1000,
+                        help="total number of operations, e.g. 1e6")
+    parser.add_argument("--cases", type=int, default=1, help="number of FIN-delimited test cases")
+    parser.add_argument("--mix", type=_parse_mix, help="command weights, e.g. nuevo=2,quitar=5")
+    parser.add_argument("--distribution", choices=["uniform", "zipf"], default="uniform")
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="Zipf exponent")
+    parser.add_argument("--keys", type=lambda text: int(float(text)), help="key universe per test case")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args()
+
+    options = dict(cases=args.cases, mix=args.mix, distribution=args.distribution, zipf_s=args.zipf_s,
+                   keys=args.keys, error_rate=args.error_rate, seed=args.seed)
+    if args.output:
+        write_workload(args.output, args.problem, args.ops, **options)
+    else:
+        for line in generate(args.problem, args.ops, **options):
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
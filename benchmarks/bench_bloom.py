@@ -0,0 +1,71 @@
+"""Benchmark: Bloom filter in front of a disk-backed or partitioned LicenseSystem.
+
+Usage (from the repository root):
+    python benchmarks/bench_bloom.py [--store partitioned|disk] [--ops 5e5] [--error-rate 0.3]
+                                     [--cache 1e4] [--filter-error 0.01] [--distribution zipf] [--seed 0]
+
+Runs a generated DrivingLicences workload in which --error-rate of the quitar and
+consultar operations ask for unregistered DNIs, on the store alone (DiskLicenseSystem
+with a --cache drivers LRU, or PartitionedLicenseSystem called one operation at a
+time) and wrapped in BloomFilteredLicenseSystem. Both must produce the same output.
+Reported: ops/s, the lookups the filter answered alone, and its observed false
+positive rate next to the one expected from its size.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+sys.path.append(".")
+
+from ads_libs import licenses
+from ads_libs.dispatch import compile_operations
+from ads_libs.workload import generate
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+from solutions.teacher.driving_licenses_bloom import BloomFilteredLicenseSystem
+from solutions.teacher.driving_licenses_disk import DiskLicenseSystem
+from solutions.teacher.driving_licenses_partitioned import PartitionedLicenseSystem
+
+
+def open_store(kind, directory, cache):
+    if kind == "disk":
+        return DiskLicenseSystem(os.path.join(directory, "drivers.db"), cache)
+    return PartitionedLicenseSystem()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    number = lambda text: int(float(text))
+    parser.add_argument("--store", choices=["disk", "partitioned"], default="partitioned")
+    parser.add_argument("--ops", type=number, default=5 * 10**5)
+    parser.add_argument("--error-rate", type=float, default=0.3)
+    parser.add_argument("--cache", type=number, default=10**4)
+    parser.add_argument("--filter-error", type=float, default=0.01)
+    parser.add_argument("--distribution", choices=["uniform", "zipf"], default="zipf")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    operations = [line for line in generate("DrivingLicences", args.ops, error_rate=args.error_rate,
+                                            distribution=args.distribution, seed=args.seed)
+                  if line != "FIN"]
+    program = compile_operations(operations, COMMANDS)
+
+    results = {}
+    for bloom in (False, True):
+        with tempfile.TemporaryDirectory() as directory, open_store(args.store, directory, args.cache) as store:
+            system = BloomFilteredLicenseSystem(store, error_rate=args.filter_error) if bloom else store
+            start = time.perf_counter()
+            results[bloom] = licenses.process_program(system, program, COMMANDS)
+            elapsed = time.perf_counter() - start
+        name = f"{args.store} + bloom" if bloom else args.store
+        print(f"{name:<20} {args.ops / elapsed:>12,.0f} ops/s")
+    assert results[False] == results[True], "outputs differ"
+
+    print(f"saved lookups        {system.saved_lookups}")
+    print(f"false positives      {system.false_positives}")
+    print(f"observed FP rate     {system.false_positive_rate():.4%}")
+    print(f"expected FP rate     {system.bloom.expected_error_rate():.4%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark: DiskLicenseSystem (SQLite + LRU cache) vs. the in-memory LicenseSystem.
+
+Usage (from the repository root):
+    python benchmarks/bench_disk.py [--ops 1e6] [--keys 2e5] [--caches 1e3,1e4,1e5]
+                                    [--distribution zipf] [--zipf-s 1.1] [--seed 0]
+
+Both run the same generated DrivingLicences workload (ads_libs.workload, one test
+case over a universe of --keys DNIs) and must produce the same output. Reported
+per run: ops/s and, for the disk version, the cache hit rate of the DNI lookups
+and the size of the database file.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+sys.path.append(".")
+
+from ads_libs import licenses
+from ads_libs.dispatch import compile_operations
+from ads_libs.workload import generate
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS, LicenseSystem
+from solutions.teacher.driving_licenses_disk import DiskLicenseSystem
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    number = lambda text: int(float(text))
+    parser.add_argument("--ops", type=number, default=10**6)
+    parser.add_argument("--keys", type=number, default=2 * 10**5)
+    parser.add_argument("--caches", default="1e3,1e4,1e5", type=lambda text: [number(c) for c in text.split(",")])
+    parser.add_argument("--distribution", choices=["uniform", "zipf"], default="zipf")
+    parser.add_argument("--zipf-s", type=float, default=1.1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    operations = [line for line in generate("DrivingLicences", args.ops, keys=args.keys, seed=args.seed,
+                                            distribution=args.distribution, zipf_s=args.zipf_s)
+                  if line != "FIN"]
+    program = compile_operations(operations, COMMANDS)
+
+    start = time.perf_counter()
+    expected = licenses.process_program(LicenseSystem(), program, COMMANDS)
+    elapsed = time.perf_counter() - start
+    print(f"{'store':<24} {'ops/s':>12} {'hit rate':>9} {'db MB':>7}")
+    print(f"{'dict (LicenseSystem)':<24} {args.ops / elapsed:>12,.0f} {'-':>9} {'-':>7}")
+
+    for cache_size in args.caches:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            with DiskLicenseSystem(os.path.join(directory, "drivers.db"), cache_size) as system:
+                output = licenses.process_program(system, program, COMMANDS)
+            elapsed = time.perf_counter() - start
+            assert output == expected, "outputs differ"
+            size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+            print(f"{f'disk, cache {cache_size}':<24} {args.ops / elapsed:>12,.0f} "
+                  f"{system.hit_rate():>9.1%} {size / 2**20:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
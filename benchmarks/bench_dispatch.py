@@ -0,0 +1,174 @@
+"""Microbenchmark: if/elif command chains vs. the table dispatch of ads_libs.dispatch.
+
+Usage (from the repository root):
+    python benchmarks/bench_dispatch.py [--scale 2000] [--repeat 5]
+
+Every problems/*/input* file is scaled up by repeating each test case --scale times,
+renaming the identifiers of every copy so the ADTs keep growing instead of hitting
+duplicate errors. Three rates are reported:
+    before  the if/elif loop the solutions used to have
+    after   the current process_operations (one pass with run_operations)
+    compile compile_operations + process_program, the cost of running a trace
+            through a compiled program once
+    replay  process_program on an already compiled program, i.e. the cost per run
+            when the same trace is replayed (see ads_libs.dispatch)
+"""
+import argparse
+import sys
+import time
+sys.path.append(".")
+
+from ads_libs.dispatch import compile_operations
+from ads_libs.io_parse import read_test_cases
+from solutions.teacher import driving_licenses
+from solutions.myleskoppelman import hw2_driving_school, hw3_music_player
+
+
+def licences_before(operations):
+    system = driving_licenses.LicenseSystem()
+    output = []
+
+    for op in operations:
+        parts = op.split()
+        command = parts[0]
+        try:
+            if command == "nuevo":
+                system.nuevo(parts[1])
+            elif command == "quitar":
+                system.quitar(parts[1], int(parts[2]))
+            elif command == "consultar":
+                points = system.consultar(parts[1])
+                output.append(f"Puntos de {parts[1]}: {points}")
+            elif command == "cuantos_con_puntos":
+                count = system.cuantos_con_puntos(int(parts[1]))
+                output.append(f"Con {parts[1]} puntos hay {count}")
+        except ValueError as e:
+            output.append(f"ERROR: {e}")
+
+    return output
+
+
+def school_before(operations):
+    school = hw2_driving_school.DrivingSchool()
+    output = []
+
+    for op in operations:
+        parts = op.split()
+        command = parts[0]
+        try:
+            if command == "alta":
+                output.append(school.alta(parts[1], parts[2]))
+            elif command == "puntuacion":
+                output.append(school.puntuacion(parts[1]))
+            elif command == "es_alumno":
+                output.append(school.es_alumno(parts[1], parts[2]))
+            elif command == "actualizar":
+                output.append(school.actualizar(parts[1], int(parts[2])))
+            elif command == "examen":
+                studs = school.examen(parts[1], int(parts[2]))
+                output.append(f"Alumnos de {parts[1]} a examen:")
+                for stud in studs:
+                    output.append(stud)
+            elif command == "aprobar":
+                output.append(school.aprobar(parts[1]))
+            else:
+                output.append("ERROR: Comando no valido\n")
+        except ValueError:
+            output.append("ERROR")
+
+    return [line for line in output if line is not None]
+
+
+def music_before(operations):
+    ipud = hw3_music_player.IPud()
+    output = []
+
+    for op in operations:
+        parts = op.split()
+        command = parts[0]
+        try:
+            if command == "addSong":
+                output.append(ipud.addSong(parts[1], parts[2], int(parts[3])))
+            elif command == "addToPlaylist":
+                output.append(ipud.addToPlaylist(parts[1]))
+            elif command == "current":
+                output.append(ipud.current())
+            elif command == "play":
+                output.append(ipud.play())
+            elif command == "totalTime":
+                output.append(f"Tiempo total {ipud.totalTime()}")
+            elif command == "recent":
+                recents = ipud.recent(int(parts[1]))
+                if recents == None:
+                    output.append("No hay canciones recients")
+                else:
+                    output.append(f"Las {parts[1]} mas recientes")
+                    for song in recents:
+                        if song is not None:
+                            output.append(f"    {song}")
+            elif command == "deleteSong":
+                ipud.deleteSong(parts[1])
+            else:
+                output.append("ERROR: Comando no valido\n")
+        except ValueError:
+            output.append(f"ERROR {command}")
+
+    return [line for line in output if line is not None]
+
+
+PROBLEMS = {
+    "DrivingLicences": ("problems/DrivingLicences/input.text", licences_before, driving_licenses),
+    "DrivingSchool": ("problems/DrivingSchool/input.txt", school_before, hw2_driving_school),
+    "MusicPlayer": ("problems/MusicPlayer/input.txt", music_before, hw3_music_player),
+}
+
+
+def scale_up(test_case, times):
+    # Repeats the test case, suffixing every non-numeric argument with the copy number
+    scaled = []
+    for copy in range(times):
+        for op in test_case:
+            command, *args = op.split()
+            args = [arg if arg.lstrip("-").isdigit() else f"{arg}_{copy}" for arg in args]
+            scaled.append(" ".join([command] + args))
+    return scaled
+
+
+def best_time(function, test_cases, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for test_case in test_cases:
+            function(test_case)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'problem':<16} {'ops':>9} {'before ops/s':>14} {'after ops/s':>14} {'compile ops/s':>14} "
+          f"{'replay ops/s':>14}")
+    for name, (input_file, before, solution) in PROBLEMS.items():
+        test_cases = [scale_up(test_case, args.scale) for test_case in read_test_cases(input_file)]
+        programs = [compile_operations(test_case, solution.COMMANDS) for test_case in test_cases]
+        for test_case, program in zip(test_cases, programs):
+            expected = before(test_case)
+            assert solution.process_operations(test_case) == expected, f"{name}: outputs differ"
+            assert solution.process_program(program) == expected, f"{name}: outputs differ"
+
+        ops = sum(len(test_case) for test_case in test_cases)
+        before_rate = ops / best_time(before, test_cases, args.repeat)
+        after_rate = ops / best_time(solution.process_operations, test_cases, args.repeat)
+        compile_rate = ops / best_time(lambda test_case: solution.process_program(
+            compile_operations(test_case, solution.COMMANDS)), test_cases, args.repeat)
+        replay_rate = ops / best_time(solution.process_program, programs, args.repeat)
+        print(f"{name:<16} {ops:>9} {before_rate:>14,.0f} {after_rate:>14,.0f} {compile_rate:>14,.0f} "
+              f"{replay_rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Memory benchmark: bytes per driver of the LicenseSystem implementations.
+
+Usage (from the repository root):
+    python benchmarks/bench_memory.py [--drivers 1e6] [--seed 0]
+
+Registers --drivers DNIs ("12345678D", the format of ads_libs.workload) in each
+implementation, takes some points from half of them, checks that all of them
+agree on consultar and cuantos_con_puntos, and reports the memory traced by
+tracemalloc for the ADT (DNI strings kept alive by it included), plus the time
+per operation of an untraced build.
+"""
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+sys.path.append(".")
+
+from solutions.teacher.driving_licenses import LicenseSystem
+from solutions.teacher.driving_licenses_compact import CompactLicenseSystem
+from solutions.teacher.driving_licenses_indexed import InternedLicenseSystem
+from solutions.teacher.driving_licenses_ranges import RangeLicenseSystem
+
+IMPLEMENTATIONS = {
+    "dict (LicenseSystem)": LicenseSystem,
+    "compact (CompactLicenseSystem)": CompactLicenseSystem,
+    "interned (InternedLicenseSystem)": InternedLicenseSystem,
+    "ranges (RangeLicenseSystem)": RangeLicenseSystem,
+}
+
+
+def build(cls, drivers, deductions):
+    dni = "{:08d}D".format
+    system = cls()
+    for i in drivers:
+        system.nuevo(dni(i))
+    for i, puntos in deductions:
+        system.quitar(dni(i), puntos)
+    return system
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drivers", type=lambda text: int(float(text)), default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    drivers = rng.sample(range(10**8), args.drivers)
+    deductions = [(i, rng.randint(1, 15)) for i in drivers[::2]]
+    probes = ["{:08d}D".format(i) for i in rng.sample(drivers, min(1000, len(drivers)))]
+
+    reference = None
+    print(f"{'implementation':<32} {'bytes/driver':>13} {'total MB':>9} {'ns/op':>9}")
+    for name, cls in IMPLEMENTATIONS.items():
+        start = time.perf_counter()
+        build(cls, drivers, deductions)
+        elapsed = time.perf_counter() - start
+
+        gc.collect()
+        tracemalloc.start()
+        system = build(cls, drivers, deductions)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        answers = ([system.consultar(dni) for dni in probes], [system.cuantos_con_puntos(p) for p in range(16)])
+        if reference is None:
+            reference = answers
+        assert answers == reference, f"{name} disagrees with {next(iter(IMPLEMENTATIONS))}"
+        print(f"{name:<32} {size / args.drivers:>13.1f} {size / 2**20:>9.1f} "
+              f"{elapsed / (args.drivers + len(deductions)) * 1e9:>9.0f}")
+        del system
+
+
+if __name__ == "__main__":
+    main()
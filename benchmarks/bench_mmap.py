@@ -0,0 +1,91 @@
+"""Benchmark: read_test_cases vs. read_test_cases_mmap, reading alone and end to end.
+
+Usage (from the repository root):
+    python benchmarks/bench_mmap.py [--ops 5e5] [--cases 10] [--repeat 5] [--seed 0]
+
+Writes a workload of --ops operations in --cases test cases for every problem
+(ads_libs.workload) and reports, for each reader:
+    read     seconds to iterate every line of every test case, best of --repeat
+    peak MB  peak memory traced by tracemalloc while doing so
+    run      seconds of `python <solution> <input> [--mmap]` with stdout discarded,
+             best of --repeat
+    RSS MB   peak resident memory of that process
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+sys.path.append(".")
+
+from ads_libs.io_parse import read_test_cases, read_test_cases_mmap
+from ads_libs.workload import write_workload
+
+SOLUTIONS = {
+    "DrivingLicences": "solutions/teacher/driving_licenses.py",
+    "DrivingSchool": "solutions/teacher/driving_school.py",
+    "MusicPlayer": "solutions/myleskoppelman/hw3_music_player.py",
+}
+READERS = {"read_test_cases": (read_test_cases, []), "read_test_cases_mmap": (read_test_cases_mmap, ["--mmap"])}
+
+
+def read_all(reader, filename):
+    lines = 0
+    for test_case in reader(filename):
+        for _ in test_case:
+            lines += 1
+    return lines
+
+
+def run_solution(solution, filename, flags): # (seconds, peak RSS in MB) of one run
+    # The solution runs as __main__ in a fresh interpreter that reports its own peak
+    # RSS (VmHWM is reset by exec, unlike ru_maxrss, which would include this process)
+    code = ("import runpy, sys; sys.argv = sys.argv[1:]; runpy.run_path(sys.argv[0], run_name='__main__'); "
+            "print(open('/proc/self/status').read().split('VmHWM:')[1].split()[0], file=sys.stderr)")
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, "-c", code, solution, filename, *flags],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True)
+    elapsed = time.perf_counter() - start
+    return elapsed, int(result.stderr.split()[-1]) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=lambda text: int(float(text)), default=5 * 10**5)
+    parser.add_argument("--cases", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'problem':<16} {'reader':<22} {'read s':>8} {'peak MB':>8} {'run s':>8} {'RSS MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for problem, solution in SOLUTIONS.items():
+            filename = os.path.join(directory, f"{problem}.txt")
+            write_workload(filename, problem, args.ops, cases=args.cases, seed=args.seed)
+            expected = [list(map(str.strip, test_case)) for test_case in read_test_cases(filename)]
+            assert [list(map(str.strip, test_case)) for test_case in read_test_cases_mmap(filename)] == expected
+
+            read_times = {name: float("inf") for name in READERS}
+            runs = {name: [] for name in READERS}
+            for _ in range(args.repeat): # the readers take turns, so machine noise hits both
+                for name, (reader, flags) in READERS.items():
+                    start = time.perf_counter()
+                    read_all(reader, filename)
+                    read_times[name] = min(read_times[name], time.perf_counter() - start)
+                    runs[name].append(run_solution(solution, filename, flags))
+
+            for name, (reader, _) in READERS.items():
+                tracemalloc.start()
+                read_all(reader, filename)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                read_time = read_times[name]
+                run_time = min(elapsed for elapsed, _ in runs[name])
+                rss = max(rss for _, rss in runs[name])
+                print(f"{problem:<16} {name:<22} {read_time:>8.3f} {peak / 2**20:>8.1f} {run_time:>8.2f} {rss:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark: NumpyLicenseSystem.quitar_bulk vs. one LicenseSystem.quitar per infraction.
+
+Usage (from the repository root):
+    python benchmarks/bench_quitar_bulk.py [--drivers 1e6] [--infractions 1e7] [--seed 0]
+
+Models a nightly import: --infractions (DNI, points) rows, with repeated DNIs and a
+few unknown ones, applied to --drivers registered drivers. Both systems must end
+in the same state; the time of each one is reported.
+"""
+import argparse
+import random
+import sys
+import time
+sys.path.append(".")
+
+from solutions.teacher.driving_licenses import LicenseSystem
+from solutions.teacher.driving_licenses_numpy import NumpyLicenseSystem
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--drivers", type=lambda text: int(float(text)), default=10**6)
+    parser.add_argument("--infractions", type=lambda text: int(float(text)), default=10**7)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    dni = "{:08d}D".format
+    dnis = [dni(rng.randrange(args.drivers + args.drivers // 100)) for _ in range(args.infractions)]
+    puntos = [rng.randint(1, 6) for _ in range(args.infractions)]
+
+    sequential, bulk = LicenseSystem(), NumpyLicenseSystem()
+    for i in range(args.drivers):
+        sequential.nuevo(dni(i))
+        bulk.nuevo(dni(i))
+
+    start = time.perf_counter()
+    unknown = 0
+    for key, deduction in zip(dnis, puntos):
+        try:
+            sequential.quitar(key, deduction)
+        except ValueError:
+            unknown += 1
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk_unknown = bulk.quitar_bulk(dnis, puntos)
+    bulk_time = time.perf_counter() - start
+
+    assert len(bulk_unknown) == unknown, "different unknown DNIs"
+    assert [bulk.cuantos_con_puntos(p) for p in range(16)] == [sequential.cuantos_con_puntos(p) for p in range(16)]
+    assert all(bulk.consultar(key) == points for key, points in sequential.drivers.items()), "different points"
+
+    print(f"{args.infractions} infractions over {args.drivers} drivers ({unknown} unknown)")
+    print(f"quitar one by one  {sequential_time:8.2f} s  {args.infractions / sequential_time:>12,.0f} rows/s")
+    print(f"quitar_bulk        {bulk_time:8.2f} s  {args.infractions / bulk_time:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark: restart time of PersistentLicenseSystem vs. replaying the operation file.
+
+Usage (from the repository root):
+    python benchmarks/bench_restart.py [--ops 2e6] [--snapshot-every 5e5] [--seed 0]
+
+A generated DrivingLicences workload (ads_libs.workload, one test case) is
+  replay     run through process_operations of the reference solution, which is
+             how the state is rebuilt without persistence
+  persisted  applied to a PersistentLicenseSystem in a temporary directory; the
+             longest nuevo/quitar call is reported, i.e. the pause a snapshot
+             costs the writer (the fork, or the whole snapshot without fork)
+  restart    the directory is opened again: latest snapshot + WAL tail
+The restarted state must equal the state of the reference ADT.
+"""
+import argparse
+import sys
+import tempfile
+import time
+sys.path.append(".")
+
+from ads_libs.dispatch import compile_operations
+from ads_libs.workload import generate
+from solutions.teacher import driving_licenses
+from solutions.teacher.driving_licenses_persistent import PersistentLicenseSystem
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=lambda text: int(float(text)), default=2 * 10**6)
+    parser.add_argument("--snapshot-every", type=lambda text: int(float(text)), default=5 * 10**5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mix = {"nuevo": 2, "quitar": 5, "consultar": 0, "cuantos_con_puntos": 0}
+    operations = [line for line in generate("DrivingLicences", args.ops, mix=mix, seed=args.seed) if line != "FIN"]
+
+    start = time.perf_counter()
+    driving_licenses.process_operations(operations)
+    replay_time = time.perf_counter() - start
+
+    reference = driving_licenses.LicenseSystem()
+    with tempfile.TemporaryDirectory() as directory:
+        system = PersistentLicenseSystem(directory, snapshot_every=args.snapshot_every)
+        handlers = {"nuevo": system.nuevo, "quitar": system.quitar}
+        reference_handlers = {"nuevo": reference.nuevo, "quitar": reference.quitar}
+        longest = 0
+        start = time.perf_counter()
+        for opcode, op_args in compile_operations(operations, driving_licenses.COMMANDS):
+            name = "nuevo" if opcode == 0 else "quitar"
+            call_start = time.perf_counter()
+            try:
+                handlers[name](*op_args)
+            except ValueError:
+                pass
+            longest = max(longest, time.perf_counter() - call_start)
+            try:
+                reference_handlers[name](*op_args)
+            except ValueError:
+                pass
+        system.close()
+        persisted_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        restarted = PersistentLicenseSystem(directory)
+        restart_time = time.perf_counter() - start
+        restarted.close()
+
+    assert restarted.drivers == reference.drivers, "restarted state differs"
+    assert restarted.points_count == reference.points_count, "restarted counts differ"
+    print(f"{args.ops} operations, {len(reference.drivers)} drivers")
+    print(f"replay of the operations  {replay_time:8.2f} s")
+    print(f"persisted run             {persisted_time:8.2f} s (reference ADT included), "
+          f"longest call {longest * 1000:.1f} ms")
+    print(f"restart from snapshot+WAL {restart_time:8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark: memory and speed of DrivingSchool with plain vs. slotted records.
+
+Usage (from the repository root):
+    python benchmarks/bench_school_records.py [--students 1e6] [--instructors 1e3]
+
+Fills a DrivingSchool with --students students spread over --instructors
+instructors (alta, then actualizar of every student) and reports the memory
+traced by tracemalloc for the school and the time per operation of an untraced
+fill. Two schools are compared:
+    hw2          solutions/myleskoppelman/hw2_driving_school.py, run once with the
+                 plain Student/Instructor classes it used to have (one __dict__
+                 per record) and once with its current __slots__ records
+    teacher      solutions/teacher/driving_school.py (slotted records and one
+                 treap node per student in the roster and in the leaderboard)
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+sys.path.append(".")
+
+from solutions.myleskoppelman import hw2_driving_school
+from solutions.teacher import driving_school
+
+
+class PlainStudent:
+    def __init__(self, name, instructor):
+        self.name = name
+        self.surname = ""
+        self.phone_num = 0
+        self.points = 0
+        self.instructor = instructor
+
+
+class PlainInstructor:
+    def __init__(self, name):
+        self.name = name
+        self.surname = ""
+        self.phone_num = 0
+        self.students = {}
+
+
+def fill(school, students, instructors):
+    for i in range(students):
+        school.alta(f"A{i}", f"P{i % instructors}")
+    for i in range(students):
+        school.actualizar(f"A{i}", i % 20)
+    return school
+
+
+def measure(make, students, instructors):
+    start = time.perf_counter()
+    fill(make(), students, instructors)
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    school = fill(make(), students, instructors)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del school
+    return size, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=lambda text: int(float(text)), default=10**6)
+    parser.add_argument("--instructors", type=lambda text: int(float(text)), default=10**3)
+    args = parser.parse_args()
+
+    slotted = hw2_driving_school.Student, hw2_driving_school.Instructor
+    runs = [
+        ("hw2, plain records", (PlainStudent, PlainInstructor), hw2_driving_school.DrivingSchool),
+        ("hw2, __slots__ records", slotted, hw2_driving_school.DrivingSchool),
+        ("teacher (treaps)", slotted, driving_school.DrivingSchool),
+    ]
+    print(f"{'school':<24} {'bytes/student':>14} {'total MB':>9} {'ns/op':>9}")
+    for name, (student, instructor), make in runs:
+        hw2_driving_school.Student, hw2_driving_school.Instructor = student, instructor
+        try:
+            size, elapsed = measure(make, args.students, args.instructors)
+        finally:
+            hw2_driving_school.Student, hw2_driving_school.Instructor = slotted
+        print(f"{name:<24} {size / args.students:>14.1f} {size / 2**20:>9.1f} "
+              f"{elapsed / (2 * args.students) * 1e9:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Stress test and throughput-vs-threads benchmark of ShardedLicenseSystem.
+
+Usage (from the repository root):
+    python benchmarks/bench_threads.py [--threads 1,2,4,8] [--ops 2e5] [--drivers 1e4] [--shards 16]
+
+stress      every thread registers its own drivers, tries to register the shared
+            ones again (always "Conductor duplicado") and takes random points from
+            the shared drivers. Deductions commute under the clamp at 0, so the
+            final points of each driver and every cuantos_con_puntos are known
+            exactly; any lost update shows up as a difference.
+throughput  ops/s of the same mixed workload (quitar 50%, consultar 40%,
+            cuantos_con_puntos 10%) split over each thread count, for
+            ShardedLicenseSystem and for LicenseSystem behind a single lock.
+"""
+import argparse
+import random
+import sys
+import threading
+import time
+sys.path.append(".")
+
+from solutions.teacher.driving_licenses import LicenseSystem
+from solutions.teacher.driving_licenses_sharded import ShardedLicenseSystem
+
+
+class LockedLicenseSystem:
+    # Baseline: the reference ADT with every operation behind one global lock
+    def __init__(self):
+        self.system = LicenseSystem()
+        self.lock = threading.Lock()
+
+    def nuevo(self, dni):
+        with self.lock:
+            self.system.nuevo(dni)
+
+    def quitar(self, dni, puntos):
+        with self.lock:
+            self.system.quitar(dni, puntos)
+
+    def consultar(self, dni):
+        with self.lock:
+            return self.system.consultar(dni)
+
+    def cuantos_con_puntos(self, puntos):
+        with self.lock:
+            return self.system.cuantos_con_puntos(puntos)
+
+
+def run_threads(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def stress(threads, ops, drivers, shards, seed):
+    system = ShardedLicenseSystem(shards)
+    shared = [f"S{i}" for i in range(drivers)]
+    for dni in shared:
+        system.nuevo(dni)
+    deducted = [dict.fromkeys(shared, 0) for _ in range(threads)]
+    failures = []
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        mine = deducted[index]
+        for j in range(ops // threads):
+            choice = rng.random()
+            if choice < 0.1:
+                system.nuevo(f"T{index}_{j}")
+            elif choice < 0.15:
+                try:
+                    system.nuevo(rng.choice(shared))
+                    failures.append("duplicate nuevo accepted")
+                except ValueError:
+                    pass
+            elif choice < 0.8:
+                dni, puntos = rng.choice(shared), rng.randint(0, 3)
+                system.quitar(dni, puntos)
+                mine[dni] += puntos
+            elif choice < 0.95:
+                if not 0 <= system.consultar(rng.choice(shared)) <= 15:
+                    failures.append("points out of range")
+            else:
+                system.cuantos_con_puntos(rng.randint(0, 15))
+
+    run_threads(threads, worker)
+
+    expected = [0] * 16
+    for dni in shared:
+        points = max(0, 15 - sum(mine[dni] for mine in deducted))
+        expected[points] += 1
+        if system.consultar(dni) != points:
+            failures.append(f"{dni} has {system.consultar(dni)} points, expected {points}")
+    own = sum(len(shard.drivers) for shard in system.shards) - drivers
+    expected[15] += own
+    counts = [system.cuantos_con_puntos(p) for p in range(16)]
+    if counts != expected:
+        failures.append(f"cuantos_con_puntos {counts}, expected {expected}")
+    return failures
+
+
+def throughput(cls, threads, ops, drivers, seed):
+    system = cls()
+    keys = [f"{i:08d}D" for i in range(drivers)]
+    for dni in keys:
+        system.nuevo(dni)
+
+    def worker(index):
+        rng = random.Random(seed + index)
+        picks = [(rng.random(), rng.choice(keys)) for _ in range(ops // threads)]
+        barrier.wait()
+        for choice, dni in picks:
+            if choice < 0.5:
+                system.quitar(dni, 1)
+            elif choice < 0.9:
+                system.consultar(dni)
+            else:
+                system.cuantos_con_puntos(7)
+
+    # Operations are drawn before the barrier, so the timed part is the ADT calls
+    barrier = threading.Barrier(threads + 1)
+    runner = threading.Thread(target=run_threads, args=(threads, worker))
+    runner.start()
+    barrier.wait()
+    start = time.perf_counter()
+    runner.join()
+    return ops / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", default="1,2,4,8", type=lambda text: [int(t) for t in text.split(",")])
+    parser.add_argument("--ops", type=lambda text: int(float(text)), default=2 * 10**5)
+    parser.add_argument("--drivers", type=lambda text: int(float(text)), default=10**4)
+    parser.add_argument("--shards", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    sys.setswitchinterval(1e-5) # switch threads often, so races are more likely to show up
+    for threads in args.threads:
+        failures = stress(threads, args.ops, args.drivers, args.shards, args.seed)
+        print(f"stress {threads} threads: {'ok' if not failures else 'FAILED'}")
+        for failure in failures[:10]:
+            print(f"    {failure}")
+    sys.setswitchinterval(0.005)
+
+    print(f"{'threads':>7} {'global lock ops/s':>18} {'sharded ops/s':>14}")
+    for threads in args.threads:
+        locked = throughput(LockedLicenseSystem, threads, args.ops, args.drivers, args.seed)
+        sharded = throughput(lambda: ShardedLicenseSystem(args.shards), threads, args.ops, args.drivers, args.seed)
+        print(f"{threads:>7} {locked:>18,.0f} {sharded:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
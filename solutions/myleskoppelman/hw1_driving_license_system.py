@@ -1,7 +1,8 @@
 import sys
 sys.path.append(".")
 
-from ads_libs.io_parse import convert_file_to_commands
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
 
 class PointBasedManagementSystem:
     def __init__(self): # O(1)
@@ -39,46 +40,43 @@ class PointBasedManagementSystem:
             raise ValueError("Puntos no validos")
         return self.arr[value]
         
+COMMANDS = {
+    "nuevo": (str,),
+    "quitar": (str, int),
+    "consultar": (str,),
+    "cuantos_con_puntos": (int,),
+}
+
 def process_operations(operations):
+    return process_program(operations, run_operations)
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
     system = PointBasedManagementSystem()
     output = []
 
-    for op in operations:
-        parts = op.split()
-        command = parts[0]
-        try:
-            if command == "nuevo":
-                system.nuevo(parts[1])
-            elif command == "quitar":
-                system.quitar(parts[1], int(parts[2]))
-            elif command == "consultar":
-                points = system.consultar(parts[1])
-                output.append(f"Puntos de {parts[1]}: {points}")
-            elif command == "cuantos_con_puntos":
-                count = system.cuantos_con_puntos(int(parts[1]))
-                output.append(f"Con {parts[1]} puntos hay {count}")
-        except ValueError as e:
-            output.append(f"ERROR: {e}")
+    def consultar(dni):
+        points = system.consultar(dni)
+        output.append(f"Puntos de {dni}: {points}")
 
-    return output
+    def cuantos_con_puntos(puntos):
+        count = system.cuantos_con_puntos(puntos)
+        output.append(f"Con {puntos} puntos hay {count}")
 
-def main():
-    if len(sys.argv) < 2:
-       raise Exception("Usage: python script.py <input_file>")
+    def error(command, e):
+        output.append(f"ERROR: {e}")
 
-    input_file = sys.argv[1]
-    operations = convert_file_to_commands(input_file)
-    
-    test_case = []
+    handlers = {
+        "nuevo": system.nuevo,
+        "quitar": system.quitar,
+        "consultar": consultar,
+        "cuantos_con_puntos": cuantos_con_puntos,
+    }
+    execute(program, COMMANDS, handlers, error)
 
-    for line in operations:
-        if line == "FIN":
-            if test_case:
-                print("\n".join(process_operations(test_case)))
-                print("---")
-                test_case = []
-        else:
-            test_case.append(line)
+    return output
+
+def main():
+    run(process_operations)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,8 @@
 import sys
 sys.path.append(".")
 
-from ads_libs.io_parse import convert_file_to_commands
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
 
 class DrivingSchool:
     def __init__(self):
@@ -110,6 +111,8 @@ class DrivingSchool:
 
         
 class Student:
+    __slots__ = ("name", "surname", "phone_num", "points", "instructor")
+
     def __init__(self, name, instructor):
         self.name = name
         self.surname = ""
@@ -123,6 +126,8 @@ class Student:
         self.phone_num = phone_num
         
 class Instructor:
+    __slots__ = ("name", "surname", "phone_num", "students")
+
     def __init__(self, name):
         self.name = name
         self.surname = ""
@@ -136,61 +141,53 @@ class Instructor:
         
         
 
+COMMANDS = {
+    "alta": (str, str),
+    "puntuacion": (str,),
+    "es_alumno": (str, str),
+    "actualizar": (str, int),
+    "examen": (str, int),
+    "aprobar": (str,),
+    None: (), # unknown command
+}
+
 def process_operations(operations):
+    return process_program(operations, run_operations)
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
     school = DrivingSchool()
     output = []
-    
-    for op in operations:
-        parts = op.split()
-        command = parts[0]
-        temp = []
 
-        try:
-            if command == "alta":
-                output.append(school.alta(parts[1], parts[2]))
-            elif command == "puntuacion":
-                output.append(school.puntuacion(parts[1])) 
-            elif command == "es_alumno":
-                output.append(school.es_alumno(parts[1], parts[2])) 
-            elif command == "actualizar":
-                output.append(school.actualizar(parts[1], int(parts[2])))
-            elif command == "examen":
-                studs = school.examen(parts[1], int(parts[2]))
-                output.append(f"Alumnos de {parts[1]} a examen:")
-                for stud in studs:
-                    output.append(stud)
-            elif command == "aprobar":
-                output.append(school.aprobar(parts[1]))
-            elif command == "FIN":
-                output.append("---")
-                break
-            else:
-                output.append("ERROR: Comando no valido\n")
-        except ValueError:
-            output.append("ERROR")
-            
-    return [line for line in output if line is not None]
+    def append(line):
+        if line is not None:
+            output.append(line)
+
+    def examen(instructor, n):
+        studs = school.examen(instructor, n)
+        output.append(f"Alumnos de {instructor} a examen:")
+        output.extend(studs)
+
+    def error(command, e):
+        output.append("ERROR")
+
+    handlers = {
+        "alta": school.alta,
+        "puntuacion": lambda student: append(school.puntuacion(student)),
+        "es_alumno": lambda student, instructor: append(school.es_alumno(student, instructor)),
+        "actualizar": school.actualizar,
+        "examen": examen,
+        "aprobar": lambda student: append(school.aprobar(student)),
+        None: lambda command: output.append("ERROR: Comando no valido\n"),
+    }
+    execute(program, COMMANDS, handlers, error)
+
+    return output
             
     
 
 
 def main():
-    if len(sys.argv) < 2:
-       raise Exception("Usage: python script.py <input_file>")
-
-    input_file = sys.argv[1]
-    operations = convert_file_to_commands(input_file)
-    
-    test_case = []
-
-    for line in operations:
-        if line == "FIN":
-            if test_case:
-                print("\n".join(process_operations(test_case)))
-                print("---")
-                test_case = []
-        else:
-            test_case.append(line)
+    run(process_operations)
 
 
 if __name__ == "__main__":
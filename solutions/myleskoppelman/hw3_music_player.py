@@ -1,7 +1,8 @@
 import sys
 sys.path.append(".")
 
-from ads_libs.io_parse import convert_file_to_commands
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
 from collections import deque
 
 
@@ -82,68 +83,60 @@ class IPud:
         
         
 
+COMMANDS = {
+    "addSong": (str, str, int),
+    "addToPlaylist": (str,),
+    "current": (),
+    "play": (),
+    "totalTime": (),
+    "recent": (int,),
+    "deleteSong": (str,),
+    None: (), # unknown command
+}
+
 def process_operations(operations):
+    return process_program(operations, run_operations)
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
     ipud = IPud()
     output = []
-    
-    for op in operations:
-        parts = op.split()
-        command = parts[0]
-
-        try:
-            if command == "addSong":
-                output.append(ipud.addSong(parts[1], parts[2], int(parts[3])))
-            elif command == "addToPlaylist":
-                output.append(ipud.addToPlaylist(parts[1])) 
-            elif command == "current":
-                output.append(ipud.current()) 
-            elif command == "play":
-                output.append(ipud.play())
-            elif command == "totalTime":
-                time = ipud.totalTime()
-                output.append(f"Tiempo total {time}")
-            elif command == "recent":
-                recents = ipud.recent(int(parts[1]))
-                n = parts[1]
-                if recents == None:
-                    output.append("No hay canciones recients")
-                else:
-                    output.append(f"Las {n} mas recientes")
-                    for song in recents:
-                        if song is not None:
-                            output.append(f"    {song}")
-            elif command == "deleteSong":
-                ipud.deleteSong(parts[1])
-            elif command == "FIN":
-                output.append("---")
-                break
-            else:
-                output.append("ERROR: Comando no valido\n")
-        except ValueError:
-            output.append(f"ERROR {command}")
-            
-    return [line for line in output if line is not None]
+
+    def totalTime():
+        time = ipud.totalTime()
+        output.append(f"Tiempo total {time}")
+
+    def recent(n):
+        recents = ipud.recent(n)
+        if recents == None:
+            output.append("No hay canciones recients")
+        else:
+            output.append(f"Las {n} mas recientes")
+            for song in recents:
+                if song is not None:
+                    output.append(f"    {song}")
+
+    def error(command, e):
+        output.append(f"ERROR {command}")
+
+    handlers = {
+        "addSong": ipud.addSong,
+        "addToPlaylist": ipud.addToPlaylist,
+        "current": lambda: output.append(ipud.current()),
+        "play": lambda: output.append(ipud.play()),
+        "totalTime": totalTime,
+        "recent": recent,
+        "deleteSong": ipud.deleteSong,
+        None: lambda command: output.append("ERROR: Comando no valido\n"),
+    }
+    execute(program, COMMANDS, handlers, error)
+
+    return output
             
     
 
 
 def main():
-    if len(sys.argv) < 2:
-       raise Exception("Usage: python script.py <input_file>")
-
-    input_file = sys.argv[1]
-    operations = convert_file_to_commands(input_file)
-    
-    test_case = []
-
-    for line in operations:
-        if line == "FIN":
-            if test_case:
-                print("\n".join(process_operations(test_case)))
-                print("---")
-                test_case = []
-        else:
-            test_case.append(line)
+    run(process_operations)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
+import sys
+sys.path.append(".")
 
-from ads_libs.io_parse import convert_file_to_commands
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
 
 
 class LicenseSystem:
@@ -35,46 +39,26 @@ class LicenseSystem:
         return self.points_count[puntos]
 
 
+# Commands of the original problem, the ones implemented by every LicenseSystem variant
+CORE_COMMANDS = {
+    "nuevo": (str,),
+    "quitar": (str, int),
+    "consultar": (str,),
+    "cuantos_con_puntos": (int,),
+}
+
+COMMANDS = CORE_COMMANDS
+
+
 def process_operations(operations): # O(p), p is the number of operaitons
-    system = LicenseSystem()
-    output = []
-
-    for op in operations:
-        parts = op.split()
-        command = parts[0]
-        try:
-            if command == "nuevo":
-                system.nuevo(parts[1])
-            elif command == "quitar":
-                system.quitar(parts[1], int(parts[2]))
-            elif command == "consultar":
-                points = system.consultar(parts[1])
-                output.append(f"Puntos de {parts[1]}: {points}")
-            elif command == "cuantos_con_puntos":
-                count = system.cuantos_con_puntos(int(parts[1]))
-                output.append(f"Con {parts[1]} puntos hay {count}")
-        except ValueError as e:
-            output.append(f"ERROR: {e}")
-
-    return output
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    return licenses.process_program(LicenseSystem(), program, COMMANDS, execute)
 
 def main():
-    if len(sys.argv) < 2:
-       raise Exception("Usage: python script.py <input_file>")
-
-    input_file = sys.argv[1]
-    operations = convert_file_to_commands(input_file)
-    
-    test_case = []
-
-    for line in operations:
-        if line == "FIN":
-            if test_case:
-                print("\n".join(process_operations(test_case)))
-                print("---")
-                test_case = []
-        else:
-            test_case.append(line)
+    run(process_operations)
 
 
 if __name__ == "__main__":
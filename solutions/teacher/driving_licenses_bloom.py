@@ -0,0 +1,85 @@
+import sys
+sys.path.append(".")
+
+from ads_libs.bloom import ScalableBloomFilter
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+from solutions.teacher.driving_licenses_partitioned import shared_system
+
+
+class BloomFilteredLicenseSystem:
+    # Wraps any LicenseSystem-like store, which must start empty, with a Bloom filter
+    # of the registered DNIs, filled on nuevo. quitar and consultar of a DNI the
+    # filter has never seen raise "Conductor inexistente" without touching the store,
+    # and nuevo of such a DNI skips the store's duplicate lookup when the store has a
+    # register method (DiskLicenseSystem). That is what makes it worth it on a
+    # disk-backed or partitioned store. The filter has no false negatives, so
+    # results are those of the store alone.
+    def __init__(self, store, capacity=1 << 16, error_rate=0.01):
+        self.store = store
+        self.bloom = ScalableBloomFilter(capacity, error_rate)
+        self.register = getattr(store, "register", None)
+        self.saved_lookups = 0  # misses answered by the filter alone
+        self.false_positives = 0  # misses the filter let through to the store
+
+    def nuevo(self, dni): # O(1) + the store's register, or its nuevo if the filter may have seen dni
+        if self.register is None:
+            self.store.nuevo(dni)
+        elif dni not in self.bloom:
+            self.saved_lookups += 1
+            self.register(dni)
+        else:
+            self.store.nuevo(dni)
+            self.false_positives += 1  # not reached for a duplicate, the store raised
+        self.bloom.add(dni)
+
+    def _check(self, dni): # O(1)
+        if dni not in self.bloom:
+            self.saved_lookups += 1
+            raise ValueError("Conductor inexistente")
+
+    def quitar(self, dni, puntos):
+        self._check(dni)
+        try:
+            self.store.quitar(dni, puntos)
+        except ValueError as e:
+            if str(e) == "Conductor inexistente":
+                self.false_positives += 1
+            raise
+
+    def consultar(self, dni):
+        self._check(dni)
+        try:
+            return self.store.consultar(dni)
+        except ValueError as e:
+            if str(e) == "Conductor inexistente":
+                self.false_positives += 1
+            raise
+
+    def cuantos_con_puntos(self, puntos):
+        return self.store.cuantos_con_puntos(puntos)
+
+    def false_positive_rate(self): # observed, among the lookups of unregistered DNIs
+        misses = self.saved_lookups + self.false_positives
+        return self.false_positives / misses if misses else 0.0
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    # In front of the partitioned store, called one operation at a time: every
+    # lookup the filter answers saves a round trip to a worker. In front of
+    # DiskLicenseSystem the filter costs more than it saves (benchmarks/bench_bloom.py).
+    system = BloomFilteredLicenseSystem(shared_system())
+    return licenses.process_program(system, program, COMMANDS, execute)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import sys
+sys.path.append(".")
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.interning import InternTable
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+
+
+class CompactLicenseSystem:
+    # Same ADT as LicenseSystem for tens of millions of drivers: no object per driver.
+    #   ids      InternTable of the DNIs, a driver's slot is the id of its DNI
+    #   points   two slots per byte, 4 bits each (points are 0..15)
+    # 27.4 bytes per driver with 10**6 drivers (benchmarks/bench_memory.py), the
+    # InternTable plus half a byte of points, against 88.8 for LicenseSystem.
+    __slots__ = ("ids", "points", "points_count")
+
+    def __init__(self, capacity=1024):
+        self.ids = InternTable(capacity)
+        self.points = bytearray()
+        self.points_count = [0] * 16  # Tracks number of drivers per points
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _get(self, slot): # O(1)
+        return (self.points[slot >> 1] >> ((slot & 1) << 2)) & 0xF
+
+    def _set(self, slot, value): # O(1)
+        shift = (slot & 1) << 2
+        byte = slot >> 1
+        self.points[byte] = (self.points[byte] & (0xF0 >> shift)) | (value << shift)
+
+    def _slot(self, dni): # O(1) expected
+        slot = self.ids.lookup(dni)
+        if slot is None:
+            raise ValueError("Conductor inexistente")
+        return slot
+
+    def nuevo(self, dni): # O(1) amortized
+        registered = len(self.ids)
+        slot = self.ids.intern(dni)
+        if slot < registered:
+            raise ValueError("Conductor duplicado")
+        if slot & 1 == 0:
+            self.points.append(0)
+        self._set(slot, 15)
+        self.points_count[15] += 1
+
+    def quitar(self, dni, puntos): # O(1)
+        slot = self._slot(dni)
+        current_points = self._get(slot)
+        self.points_count[current_points] -= 1
+        new_points = max(0, current_points - puntos)
+        self._set(slot, new_points)
+        self.points_count[new_points] += 1
+
+    def consultar(self, dni): # O(1)
+        return self._get(self._slot(dni))
+
+    def cuantos_con_puntos(self, puntos): # O(1)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return self.points_count[puntos]
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    return licenses.process_program(CompactLicenseSystem(), program, COMMANDS, execute)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import sys
+sys.path.append(".")
+import os
+import sqlite3
+import tempfile
+from collections import OrderedDict
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+
+_COMMIT_EVERY = 10000  # write-backs per transaction
+
+
+class DiskLicenseSystem:
+    # Same ADT as LicenseSystem for more drivers than fit in memory: the DNI -> points
+    # map is a SQLite table (WAL journal) behind an LRU write-back cache of
+    # cache_size drivers. A cached driver is read and updated in memory; it is only
+    # written to the table when it is evicted or on flush(). points_count stays in
+    # memory, so cuantos_con_puntos never touches the disk.
+    def __init__(self, path, cache_size=100000):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("CREATE TABLE IF NOT EXISTS drivers (dni TEXT PRIMARY KEY, points INTEGER NOT NULL) WITHOUT ROWID")
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # dni -> [points, dirty], least recently used first
+        self.pending = 0  # write-backs since the last commit
+        self.hits = 0
+        self.misses = 0
+        # Tracks number of drivers per points; O(n) once if the table already has drivers
+        self.points_count = [0] * 16
+        for points, count in self.db.execute("SELECT points, COUNT(*) FROM drivers GROUP BY points"):
+            self.points_count[points] = count
+
+    def _write_back(self, dni, points): # O(log n), a B-tree insert
+        self.db.execute("INSERT OR REPLACE INTO drivers VALUES (?, ?)", (dni, points))
+        self.pending += 1
+        if self.pending >= _COMMIT_EVERY:
+            self.db.commit()
+            self.pending = 0
+
+    def _cache(self, dni, points, dirty): # O(1) amortized, evicts the least recently used driver
+        entry = self.cache[dni] = [points, dirty]
+        if len(self.cache) > self.cache_size:
+            evicted, (evicted_points, evicted_dirty) = self.cache.popitem(last=False)
+            if evicted_dirty:
+                self._write_back(evicted, evicted_points)
+        return entry
+
+    def _entry(self, dni): # O(1) on a hit, O(log n) on a miss; None if not registered
+        entry = self.cache.get(dni)
+        if entry is not None:
+            self.cache.move_to_end(dni)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        row = self.db.execute("SELECT points FROM drivers WHERE dni = ?", (dni,)).fetchone()
+        if row is None:
+            return None
+        return self._cache(dni, row[0], False)
+
+    def nuevo(self, dni): # O(log n)
+        if self._entry(dni) is not None:
+            raise ValueError("Conductor duplicado")
+        self._cache(dni, 15, True)
+        self.points_count[15] += 1
+
+    def register(self, dni): # O(1) amortized, nuevo for a DNI the caller knows is not registered
+        # Skips the lookup that detects duplicates (BloomFilteredLicenseSystem calls it
+        # when its filter has never seen the DNI)
+        self._cache(dni, 15, True)
+        self.points_count[15] += 1
+
+    def quitar(self, dni, puntos): # O(1) on a hit, O(log n) on a miss
+        entry = self._entry(dni)
+        if entry is None:
+            raise ValueError("Conductor inexistente")
+
+        current_points = entry[0]
+        self.points_count[current_points] -= 1
+        new_points = max(0, current_points - puntos)
+        entry[0], entry[1] = new_points, True
+        self.points_count[new_points] += 1
+
+    def consultar(self, dni): # O(1) on a hit, O(log n) on a miss
+        entry = self._entry(dni)
+        if entry is None:
+            raise ValueError("Conductor inexistente")
+        return entry[0]
+
+    def cuantos_con_puntos(self, puntos): # O(1)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return self.points_count[puntos]
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def flush(self): # O(c log n), c is the cache size
+        for dni, entry in self.cache.items():
+            if entry[1]:
+                self._write_back(dni, entry[0])
+                entry[1] = False
+        self.db.commit()
+        self.pending = 0
+
+    def close(self):
+        self.flush()
+        self.db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def process_operations(operations): # O(p log n), p is the number of operations
+    return process_program(operations, execute=run_operations)
+
+
+def process_program(program, path=None, cache_size=100000, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    # Each test case starts from an empty ADT, so by default the table lives in a
+    # temporary directory that is removed afterwards
+    if path is None:
+        with tempfile.TemporaryDirectory() as directory:
+            return process_program(program, os.path.join(directory, "drivers.db"), cache_size, execute)
+
+    with DiskLicenseSystem(path, cache_size) as system:
+        return licenses.process_program(system, program, COMMANDS, execute)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
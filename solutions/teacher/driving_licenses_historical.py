@@ -0,0 +1,138 @@
+import sys
+sys.path.append(".")
+from array import array
+from bisect import bisect_right
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.interning import InternTable
+from ads_libs.runner import run
+
+# nuevo and quitar carry the time they happen at as their last argument (times
+# must not decrease); the _en queries ask about the state at a given time, i.e.
+# after every nuevo/quitar with a time <= t
+COMMANDS = {
+    "nuevo": (str, int),
+    "quitar": (str, int, int),
+    "consultar": (str,),
+    "cuantos_con_puntos": (int,),
+    "consultar_en": (str, int),
+    "cuantos_con_puntos_en": (int, int),
+}
+
+
+class HistoricalLicenseSystem:
+    # LicenseSystem that also answers queries about any past time.
+    #   versions     per driver id, the times of its nuevo/quitar events and its
+    #                points after each one, so consultar_en is a binary search over
+    #                that driver's own history only.
+    #   per-points   for each number of points, the times at which its count changed
+    #                and the count after each change, so cuantos_con_puntos_en is a
+    #                binary search.
+    def __init__(self):
+        self.ids = InternTable()  # dni -> driver id; only nuevo interns, so every id is registered
+        self.version_times = []  # driver id -> array of event times
+        self.version_points = []  # driver id -> bytearray of the points after each event
+        self.points_count = [0] * 16  # Tracks number of drivers per points
+        self.last_time = None  # of the last nuevo/quitar that succeeded
+
+        self.count_times = [array("q") for _ in range(16)]
+        self.count_values = [array("q") for _ in range(16)]
+
+    def _check_time(self, time): # O(1)
+        if self.last_time is not None and time < self.last_time:
+            raise ValueError("Tiempo no valido")
+
+    def _count(self, points, delta, time): # O(1) amortized
+        self.points_count[points] += delta
+        times, values = self.count_times[points], self.count_values[points]
+        if times and times[-1] == time:
+            values[-1] = self.points_count[points]
+        else:
+            times.append(time)
+            values.append(self.points_count[points])
+
+    def _driver(self, dni): # O(1)
+        driver = self.ids.lookup(dni)
+        if driver is None:
+            raise ValueError("Conductor inexistente")
+        return driver
+
+    def nuevo(self, dni, time): # O(1) amortized
+        self._check_time(time)
+        if dni in self.ids:
+            raise ValueError("Conductor duplicado")
+        self.ids.intern(dni)
+        self.version_times.append(array("q", [time]))
+        self.version_points.append(bytearray((15,)))
+        self._count(15, 1, time)
+        self.last_time = time
+
+    def quitar(self, dni, puntos, time): # O(1) amortized
+        self._check_time(time)
+        driver = self._driver(dni)
+        points = self.version_points[driver]
+        current_points = points[-1]
+        new_points = max(0, current_points - puntos)
+        if new_points != current_points:
+            self._count(current_points, -1, time)
+            self._count(new_points, 1, time)
+        self.version_times[driver].append(time)
+        points.append(new_points)
+        self.last_time = time
+
+    def consultar(self, dni): # O(1)
+        return self.version_points[self._driver(dni)][-1]
+
+    def cuantos_con_puntos(self, puntos): # O(1)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return self.points_count[puntos]
+
+    def consultar_en(self, dni, time): # O(log v), v is the number of events of that driver
+        driver = self._driver(dni)
+        version = bisect_right(self.version_times[driver], time) - 1
+        if version < 0: # registered after time
+            raise ValueError("Conductor inexistente")
+        return self.version_points[driver][version]
+
+    def cuantos_con_puntos_en(self, puntos, time): # O(log e)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        change = bisect_right(self.count_times[puntos], time) - 1
+        return self.count_values[puntos][change] if change >= 0 else 0
+
+
+# nuevo and quitar take a time as an extra argument, which the workloads of
+# ads_libs.workload do not generate (ads_libs.discovery skips this file)
+DISCOVERABLE = False
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    system = HistoricalLicenseSystem()
+    output = []
+
+    def consultar_en(dni, time):
+        points = system.consultar_en(dni, time)
+        output.append(f"Puntos de {dni} en {time}: {points}")
+
+    def cuantos_con_puntos_en(puntos, time):
+        count = system.cuantos_con_puntos_en(puntos, time)
+        output.append(f"Con {puntos} puntos en {time} habia {count}")
+
+    handlers = {
+        "consultar_en": consultar_en,
+        "cuantos_con_puntos_en": cuantos_con_puntos_en,
+    }
+    return licenses.process_program(system, program, COMMANDS, execute, handlers, output)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+import sys
+sys.path.append(".")
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.interning import InternTable
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+
+NOT_REGISTERED = 255
+
+
+class IndexedLicenseSystem:
+    # Same ADT as LicenseSystem, but drivers are dense ids from an InternTable:
+    # points are one byte per driver in a bytearray indexed by id, so there is
+    # no boxed int per driver. The DNIs themselves are only in the InternTable.
+    def __init__(self):
+        self.points = bytearray()  # id -> points, NOT_REGISTERED if nuevo was never called
+        self.points_count = [0] * 16  # Tracks number of drivers per points
+
+    def _current(self, driver): # O(1)
+        if driver >= len(self.points) or self.points[driver] == NOT_REGISTERED:
+            raise ValueError("Conductor inexistente")
+        return self.points[driver]
+
+    def nuevo(self, driver): # O(1) amortized, the array grows up to the largest id
+        if driver >= len(self.points):
+            self.points.extend(bytes([NOT_REGISTERED]) * (driver + 1 - len(self.points)))
+        if self.points[driver] != NOT_REGISTERED:
+            raise ValueError("Conductor duplicado")
+        self.points[driver] = 15
+        self.points_count[15] += 1
+
+    def quitar(self, driver, puntos): # O(1)
+        current_points = self._current(driver)
+        self.points_count[current_points] -= 1
+        new_points = max(0, current_points - puntos)
+        self.points[driver] = new_points
+        self.points_count[new_points] += 1
+
+    def consultar(self, driver): # O(1)
+        return self._current(driver)
+
+    def cuantos_con_puntos(self, puntos): # O(1)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return self.points_count[puntos]
+
+
+class InternedLicenseSystem(IndexedLicenseSystem):
+    # IndexedLicenseSystem taking DNIs: nuevo interns them and the other
+    # operations only look them up, so unknown DNIs never grow the table.
+    # About 30 bytes per driver in total, against ~100 for LicenseSystem's dict.
+    def __init__(self):
+        super().__init__()
+        self.table = InternTable()
+
+    def _driver(self, dni): # O(1) expected
+        driver = self.table.lookup(dni)
+        if driver is None:
+            raise ValueError("Conductor inexistente")
+        return driver
+
+    def nuevo(self, dni): # O(1) amortized
+        super().nuevo(self.table.intern(dni))
+
+    def quitar(self, dni, puntos): # O(1) expected
+        super().quitar(self._driver(dni), puntos)
+
+    def consultar(self, dni): # O(1) expected
+        return super().consultar(self._driver(dni))
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, execute=run_operations)
+
+
+def process_program(program, table=None, execute=run_compiled):
+    # Runs a program compiled by ads_libs.dispatch, or operations with run_operations.
+    # Without a table the DNIs are strings, interned by InternedLicenseSystem; with
+    # one (ads_libs.oplog replay --interned) the program already holds their ids.
+    if table is None:
+        return licenses.process_program(InternedLicenseSystem(), program, COMMANDS, execute)
+
+    system = IndexedLicenseSystem()
+    output = []
+
+    def consultar(driver):
+        points = system.consultar(driver)
+        output.append(f"Puntos de {table.key(driver)}: {points}")
+
+    return licenses.process_program(system, program, COMMANDS, execute, {"consultar": consultar}, output)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
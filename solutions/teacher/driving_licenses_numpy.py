@@ -0,0 +1,159 @@
+import sys
+sys.path.append(".")
+from itertools import repeat
+
+import numpy as np
+
+from ads_libs.dispatch import compile_operations, run_compiled
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+
+NOT_REGISTERED = 255
+
+
+class NumpyLicenseSystem:
+    # Same ADT as LicenseSystem with the DNIs interned to rows of a uint8 NumPy
+    # array, so a whole batch of infractions can be applied at once (quitar_bulk).
+    # Needs numpy, which is not required by the other solutions.
+    def __init__(self, capacity=1024):
+        self.rows = {}  # dni -> row, a dict so quitar_bulk can map its get over a batch
+        self.points = np.full(capacity, NOT_REGISTERED, dtype=np.uint8)  # row -> points
+        self.points_count = np.zeros(16, dtype=np.int64)  # Tracks number of drivers per points
+
+    def _row(self, dni): # O(1)
+        row = self.rows.get(dni)
+        if row is None or self.points[row] == NOT_REGISTERED:
+            raise ValueError("Conductor inexistente")
+        return row
+
+    def nuevo(self, dni): # O(1) amortized, the array doubles when full
+        row = self.rows.setdefault(dni, len(self.rows))
+        if row >= len(self.points):
+            grown = np.full(2 * len(self.points), NOT_REGISTERED, dtype=np.uint8)
+            grown[:len(self.points)] = self.points
+            self.points = grown
+        if self.points[row] != NOT_REGISTERED:
+            raise ValueError("Conductor duplicado")
+        self.points[row] = 15
+        self.points_count[15] += 1
+
+    def quitar(self, dni, puntos): # O(1)
+        row = self._row(dni)
+        current_points = int(self.points[row])
+        self.points_count[current_points] -= 1
+        new_points = max(0, current_points - puntos)
+        self.points[row] = new_points
+        self.points_count[new_points] += 1
+
+    def quitar_bulk(self, dnis, puntos): # O(b log b), b is the size of the batch
+        # Applies quitar(dnis[i], puntos[i]) for every i, with the same final state as
+        # applying them one by one. Returns the positions in the batch of the DNIs that
+        # are not registered (the ones for which quitar would raise), in order.
+        # Deductions never add points, so for each driver the sequential result is
+        # max(0, points - sum of its deductions), duplicates included. A negative
+        # deduction breaks that (the clamp would depend on the order), so such batches
+        # are applied one by one. A deduction of 15 or more empties any licence, so
+        # deductions are capped at 15 and always fit the int64 array.
+        puntos = np.asarray([min(p, 15) for p in puntos], dtype=np.int64)
+        if len(dnis) != len(puntos):
+            raise ValueError("dnis and puntos must have the same length")
+        if len(puntos) and puntos.min() < 0:
+            unknown = []
+            for i, (dni, deduction) in enumerate(zip(dnis, puntos.tolist())):
+                try:
+                    self.quitar(dni, deduction)
+                except ValueError:
+                    unknown.append(i)
+            return unknown
+
+        # The DNI -> row lookups are the only per-item Python work left (map runs them in C)
+        rows = np.fromiter(map(self.rows.get, dnis, repeat(-1)), dtype=np.int64, count=len(dnis))
+        known = rows >= 0
+        known[known] = self.points[rows[known]] != NOT_REGISTERED
+        unknown = np.flatnonzero(~known).tolist()
+
+        # Total deduction per affected row: a bincount over all the rows for large
+        # batches, over the distinct rows of the batch for small ones
+        rows, puntos = rows[known], puntos[known]
+        if 8 * len(rows) >= len(self.points):
+            totals = np.bincount(rows, weights=puntos, minlength=len(self.points))
+            affected = np.flatnonzero(totals)
+            totals = totals[affected]
+        else:
+            affected, inverse = np.unique(rows, return_inverse=True)
+            totals = np.bincount(inverse, weights=puntos, minlength=len(affected))
+        old_points = self.points[affected]
+        new_points = np.maximum(old_points.astype(np.int64) - totals.astype(np.int64), 0).astype(np.uint8)
+        self.points[affected] = new_points
+        self.points_count += np.bincount(new_points, minlength=16) - np.bincount(old_points, minlength=16)
+        return unknown
+
+    def consultar(self, dni): # O(1)
+        return int(self.points[self._row(dni)])
+
+    def cuantos_con_puntos(self, puntos): # O(1)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return int(self.points_count[puntos])
+
+
+# process_program reads the whole program and applies every run of quitar as one
+# batch, so ads_libs.bench reports no per-operation latency for it
+BATCHED = True
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(compile_operations(operations, COMMANDS))
+
+
+def process_program(program): # runs operations already compiled by ads_libs.dispatch
+    # Consecutive quitar operations only produce output on errors, so every run of
+    # them is applied with a single quitar_bulk and its errors are reported in order.
+    # The program may be any iterable, e.g. a generator; it is read in full first.
+    program = list(program)
+    system = NumpyLicenseSystem()
+    output = []
+    quitar = list(COMMANDS).index("quitar")
+
+    def consultar(dni):
+        points = system.consultar(dni)
+        output.append(f"Puntos de {dni}: {points}")
+
+    def cuantos_con_puntos(puntos):
+        count = system.cuantos_con_puntos(puntos)
+        output.append(f"Con {puntos} puntos hay {count}")
+
+    def error(command, e):
+        output.append(f"ERROR: {e}")
+
+    handlers = {
+        "nuevo": system.nuevo,
+        "quitar": system.quitar,
+        "consultar": consultar,
+        "cuantos_con_puntos": cuantos_con_puntos,
+    }
+
+    start = 0
+    while start < len(program):
+        end = start
+        while end < len(program) and program[end][0] == quitar:
+            end += 1
+        if end - start > 1:
+            dnis, puntos = zip(*(args for _, args in program[start:end]))
+            for _ in system.quitar_bulk(dnis, puntos):
+                output.append("ERROR: Conductor inexistente")
+        else:
+            end = start + 1
+            while end < len(program) and program[end][0] != quitar:
+                end += 1
+            run_compiled(program[start:end], COMMANDS, handlers, error)
+        start = end
+
+    return output
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
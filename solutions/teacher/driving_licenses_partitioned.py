@@ -0,0 +1,231 @@
+import sys
+sys.path.append(".")
+import multiprocessing
+import multiprocessing.util
+import weakref
+from multiprocessing import shared_memory
+
+from ads_libs.dispatch import RAISE, compile_operations
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+
+NUEVO, QUITAR, CONSULTAR, CUANTOS = range(4)  # opcodes of COMMANDS
+RESET = "reset"
+
+
+def _partition(conn, shm_name, row):
+    # Worker process owning one partition of the drivers. Receives batches of
+    # (opcode, args) and answers each batch with one result per operation: None,
+    # the points for consultar, or the error message. Its row of the shared
+    # histogram is only written here.
+    shm = shared_memory.SharedMemory(shm_name)
+    counts = shm.buf.cast("q")
+    base = 16 * row
+    drivers = {}
+    try:
+        while True:
+            batch = conn.recv()
+            if batch is None:
+                return
+            if batch == RESET:
+                drivers.clear()
+                for points in range(16):
+                    counts[base + points] = 0
+                conn.send(None)
+                continue
+            results = []
+            for opcode, args in batch:
+                dni = args[0]
+                current_points = drivers.get(dni)
+                if opcode == NUEVO:
+                    if current_points is not None:
+                        results.append("Conductor duplicado")
+                        continue
+                    drivers[dni] = 15
+                    counts[base + 15] += 1
+                    results.append(None)
+                elif current_points is None:
+                    results.append("Conductor inexistente")
+                elif opcode == QUITAR:
+                    new_points = max(0, current_points - args[1])
+                    drivers[dni] = new_points
+                    counts[base + current_points] -= 1
+                    counts[base + new_points] += 1
+                    results.append(None)
+                else:
+                    results.append(current_points)
+            conn.send(results)
+    finally:
+        counts.release()
+        shm.close()
+
+
+def _release(shm, counts, connections, workers):
+    # Stops the workers and frees the shared histogram. Holds no reference to the
+    # system, so it can run as its weakref.finalize callback once it is dropped.
+    for connection in connections:
+        connection.send(None)
+        connection.close()
+    for worker in workers:
+        worker.join()
+    counts.release()
+    shm.close()
+    shm.unlink()
+
+
+class PartitionedLicenseSystem:
+    # Same ADT as LicenseSystem with the drivers split by DNI hash over worker
+    # processes, one partition each. The per-points counters are a partitions x 16
+    # int64 table in shared memory: every worker writes its own row, and
+    # cuantos_con_puntos adds up a column in this process, with no message at all.
+    # Operations can be sent one at a time (nuevo, quitar, consultar) or queued
+    # with submit() and sent in one message per partition by flush(). The workers
+    # and the shared memory are released by close(), or when the system is dropped.
+    def __init__(self, partitions=4):
+        self.shm = shared_memory.SharedMemory(create=True, size=16 * 8 * partitions)
+        self.counts = self.shm.buf.cast("q")
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.connections = []
+        self.workers = []
+        for row in range(partitions):
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_partition, args=(child, self.shm.name, row), daemon=True)
+            worker.start()
+            child.close()
+            self.connections.append(parent)
+            self.workers.append(worker)
+        self.batches = [[] for _ in range(partitions)]
+        self.tickets = [[] for _ in range(partitions)]
+        self._release = weakref.finalize(self, _release, self.shm, self.counts, self.connections, self.workers)
+
+    def _partition(self, dni): # O(1), routing is only ever computed in this process
+        return hash(dni) % len(self.connections)
+
+    def submit(self, opcode, args, ticket=None): # O(1), queued until flush()
+        partition = self._partition(args[0])
+        self.batches[partition].append((opcode, args))
+        self.tickets[partition].append(ticket)
+
+    def pending(self):
+        return sum(len(batch) for batch in self.batches)
+
+    def flush(self): # O(b), b is the number of queued operations
+        # Sends every queued batch, then waits for all of them, so the shared counters
+        # include every queued operation on return. Yields (ticket, result) pairs,
+        # in submission order within each partition.
+        sent = []
+        for partition, batch in enumerate(self.batches):
+            if batch:
+                self.connections[partition].send(batch)
+                sent.append(partition)
+        for partition in sent:
+            yield from zip(self.tickets[partition], self.connections[partition].recv())
+            self.batches[partition] = []
+            self.tickets[partition] = []
+
+    def _call(self, opcode, args):
+        self.submit(opcode, args)
+        ((_, result),) = self.flush()
+        if isinstance(result, str):
+            raise ValueError(result)
+        return result
+
+    def nuevo(self, dni): # O(1), one round trip
+        self._call(NUEVO, (dni,))
+
+    def quitar(self, dni, puntos): # O(1), one round trip
+        self._call(QUITAR, (dni, puntos))
+
+    def consultar(self, dni): # O(1), one round trip
+        return self._call(CONSULTAR, (dni,))
+
+    def cuantos_con_puntos(self, puntos): # O(partitions), no message to the workers
+        # Only counts operations already flushed
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return sum(self.counts[puntos::16])
+
+    def reset(self): # O(n), empties every partition and keeps the workers
+        for _ in self.flush():
+            pass
+        for connection in self.connections:
+            connection.send(RESET)
+        for connection in self.connections:
+            connection.recv()
+
+    def close(self): # idempotent
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+BATCH_SIZE = 4096
+_system = None
+
+
+def shared_system():
+    # Starting the workers costs far more than a test case, so one system is
+    # reset and reused by every process_program call of this process. Process pool
+    # workers leave through os._exit, which skips the exit hook of weakref.finalize,
+    # so the release is also registered with the exit finalizers of multiprocessing.
+    global _system
+    if _system is None:
+        _system = PartitionedLicenseSystem()
+        multiprocessing.util.Finalize(None, _system._release, exitpriority=0)
+    else:
+        _system.reset()
+    return _system
+
+
+# process_program queues up to BATCH_SIZE operations before running them, so
+# ads_libs.bench reports no per-operation latency for it
+BATCHED = True
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(compile_operations(operations, COMMANDS))
+
+
+def process_program(program): # runs operations already compiled by ads_libs.dispatch
+    # nuevo, quitar and consultar are queued with a placeholder in the output and
+    # the batches are flushed every BATCH_SIZE operations and before every
+    # cuantos_con_puntos, which then reads the up to date shared counters.
+    system = shared_system()
+    output = []
+
+    def flush():
+        for (position, dni), result in system.flush():
+            if isinstance(result, str):
+                output[position] = f"ERROR: {result}"
+            elif result is not None:
+                output[position] = f"Puntos de {dni}: {result}"
+
+    for opcode, args in program:
+        if opcode == RAISE:
+            output.append(f"ERROR: {args[1]}")
+        elif opcode == CUANTOS:
+            flush()
+            try:
+                output.append(f"Con {args[0]} puntos hay {system.cuantos_con_puntos(args[0])}")
+            except ValueError as e:
+                output.append(f"ERROR: {e}")
+        else:
+            system.submit(opcode, args, (len(output), args[0]))
+            output.append(None)
+            if system.pending() >= BATCH_SIZE:
+                flush()
+    flush()
+
+    return [line for line in output if line is not None]
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+import sys
+sys.path.append(".")
+import os
+import tempfile
+
+from ads_libs import licenses
+from ads_libs.codec import read_bytes, read_varint, unzigzag, write_bytes, write_varint, zigzag
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS, LicenseSystem
+
+SNAPSHOT_MAGIC = b"ADSSNAP1\n"
+NUEVO, QUITAR = 1, 2  # WAL record types
+
+
+def _segment_name(seq):
+    return f"wal-{seq:08d}.log"
+
+
+def _snapshot_name(seq):
+    return f"snapshot-{seq:08d}.bin"
+
+
+def _files(directory, prefix, suffix):
+    # {seq: filename} of the WAL segments or snapshots in directory
+    found = {}
+    for name in os.listdir(directory):
+        if name.startswith(prefix) and name.endswith(suffix):
+            found[int(name[len(prefix):-len(suffix)])] = name
+    return found
+
+
+class PersistentLicenseSystem(LicenseSystem):
+    # LicenseSystem whose state survives restarts without replaying every operation.
+    # Successful nuevo/quitar calls are appended to a write-ahead log split into
+    # numbered segments (wal-N.log); every `snapshot_every` records the current
+    # segment is closed, a new one is started and snapshot-N+1.bin is written with
+    # every driver, so it covers exactly the segments before N+1. The snapshot is
+    # written by a forked child working on a copy-on-write image of the state, so
+    # quitar only waits for the fork itself; where fork is not available it is
+    # written in place. Once a snapshot is complete, older snapshots and segments
+    # are deleted. Opening a directory loads the latest snapshot and replays the
+    # segments after it; a record cut short by a crash ends the replay.
+    # Records: type byte, DNI (varint length + utf-8), and for quitar the points
+    # (zigzag varint). With sync=True every record is fsync'ed before returning.
+    def __init__(self, directory, snapshot_every=1 << 20, sync=False):
+        super().__init__()
+        self.directory = directory
+        self.snapshot_every = snapshot_every
+        self.sync = sync
+        self.snapshotter = None  # (pid, seq) of the child writing a snapshot
+        os.makedirs(directory, exist_ok=True)
+        self.seq = self._recover()
+        self.records = 0
+        self.wal = open(self._path(_segment_name(self.seq)), "ab")
+
+    def _path(self, name):
+        return os.path.join(self.directory, name)
+
+    def _recover(self): # O(snapshot + WAL tail); returns the seq of the segment to write next
+        snapshots = _files(self.directory, "snapshot-", ".bin")
+        segments = _files(self.directory, "wal-", ".log")
+        start = max(snapshots, default=0)
+        if snapshots:
+            self._load_snapshot(self._path(snapshots[start]))
+        for seq in sorted(segments):
+            if seq >= start:
+                self._replay(self._path(segments[seq]))
+        # Never append to a segment that may end in a torn record
+        return max(list(segments) + [start]) + 1
+
+    def _load_snapshot(self, filename): # O(n)
+        with open(filename, "rb") as file:
+            data = file.read()
+        if data[:len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+            raise ValueError(f"{filename} is not a snapshot")
+        count, pos = read_varint(data, len(SNAPSHOT_MAGIC))
+        for _ in range(count):
+            dni, pos = read_bytes(data, pos)
+            dni = dni.decode()
+            super().nuevo(dni)
+            super().quitar(dni, 15 - data[pos])
+            pos += 1
+
+    def _replay(self, filename): # O(records)
+        with open(filename, "rb") as file:
+            data = file.read()
+        pos = 0
+        try:
+            while pos < len(data):
+                kind = data[pos]
+                dni, end = read_bytes(data, pos + 1)
+                if end > len(data):
+                    break
+                dni = dni.decode()
+                if kind == NUEVO:
+                    super().nuevo(dni)
+                else:
+                    puntos, end = read_varint(data, end)
+                    super().quitar(dni, unzigzag(puntos))
+                pos = end
+        except (IndexError, UnicodeDecodeError):
+            pass # torn record at the end of the last segment
+
+    def _append(self, record): # O(1) amortized
+        self.wal.write(record)
+        if self.sync:
+            self.wal.flush()
+            os.fsync(self.wal.fileno())
+        self.records += 1
+        if self.records >= self.snapshot_every:
+            self.snapshot()
+
+    def nuevo(self, dni): # O(1) amortized plus a WAL append
+        super().nuevo(dni)
+        record = bytearray((NUEVO,))
+        write_bytes(record, dni.encode())
+        self._append(record)
+
+    def quitar(self, dni, puntos): # O(1) amortized plus a WAL append
+        super().quitar(dni, puntos)
+        record = bytearray((QUITAR,))
+        write_bytes(record, dni.encode())
+        write_varint(record, zigzag(puntos))
+        self._append(record)
+
+    def _write_snapshot(self, seq): # O(n)
+        data = bytearray(SNAPSHOT_MAGIC)
+        write_varint(data, len(self.drivers))
+        for dni, points in self.drivers.items():
+            write_bytes(data, dni.encode())
+            data.append(points)
+        temporary = self._path(_snapshot_name(seq) + ".tmp")
+        with open(temporary, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._path(_snapshot_name(seq)))
+
+    def _reap(self, block=False): # True if no snapshot is being written any more
+        if self.snapshotter is None:
+            return True
+        pid, seq = self.snapshotter
+        done, status = os.waitpid(pid, 0 if block else os.WNOHANG)
+        if done == 0:
+            return False
+        self.snapshotter = None
+        if os.waitstatus_to_exitcode(status) == 0:
+            self._compact(seq)
+        return True
+
+    def _compact(self, seq): # deletes what snapshot seq makes unnecessary
+        for old, name in _files(self.directory, "snapshot-", ".bin").items():
+            if old < seq:
+                os.remove(self._path(name))
+        for old, name in _files(self.directory, "wal-", ".log").items():
+            if old < seq:
+                os.remove(self._path(name))
+
+    def snapshot(self): # O(1) for the caller with fork, O(n) without
+        if not self._reap():
+            return # the previous snapshot is still being written, try again later
+        self.wal.close()
+        self.seq += 1
+        self.records = 0
+        self.wal = open(self._path(_segment_name(self.seq)), "ab")
+        if not hasattr(os, "fork"):
+            self._write_snapshot(self.seq)
+            self._compact(self.seq)
+            return
+        pid = os.fork()
+        if pid == 0:
+            try:
+                self._write_snapshot(self.seq)
+                os._exit(0)
+            except BaseException:
+                os._exit(1)
+        self.snapshotter = (pid, self.seq)
+
+    def close(self):
+        self._reap(block=True)
+        self.wal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, execute=run_operations)
+
+
+def process_program(program, directory=None, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    # Each test case starts from an empty ADT, so by default it persists to a
+    # temporary directory that is removed afterwards
+    if directory is None:
+        with tempfile.TemporaryDirectory() as directory:
+            return process_program(program, directory, execute)
+
+    with PersistentLicenseSystem(directory) as system:
+        return licenses.process_program(system, program, COMMANDS, execute)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
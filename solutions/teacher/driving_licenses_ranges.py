@@ -0,0 +1,84 @@
+import sys
+sys.path.append(".")
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.fenwick import FenwickTree
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS, LicenseSystem
+
+
+class RangeLicenseSystem(LicenseSystem):
+    # LicenseSystem with two more queries: drivers in a range of points and the DNIs
+    # of the drivers with a number of points. Kept out of LicenseSystem because the
+    # extra index per driver about doubles its memory (benchmarks/bench_memory.py).
+    def __init__(self):
+        super().__init__()
+        # Same counts as points_count in a Fenwick tree, for the number of drivers in a range of points
+        self.points_tree = FenwickTree(16)
+        # Drivers with each number of points; dicts used as insertion-ordered sets
+        self.points_drivers = [{} for _ in range(16)]
+
+    def nuevo(self, dni): # O(log 16)
+        super().nuevo(dni)
+        self.points_tree.add(15, 1)
+        self.points_drivers[15][dni] = None
+
+    def quitar(self, dni, puntos): # O(log 16)
+        current_points = self.consultar(dni)
+        super().quitar(dni, puntos)
+        new_points = self.drivers[dni]
+        if new_points != current_points:
+            self.points_tree.add(current_points, -1)
+            del self.points_drivers[current_points][dni]
+            self.points_tree.add(new_points, 1)
+            self.points_drivers[new_points][dni] = None
+
+    def cuantos_en_rango(self, lo, hi): # O(log 16), drivers with lo..hi points, both included
+        if not (0 <= lo <= 15 and 0 <= hi <= 15):
+            raise ValueError("Puntos no validos")
+        return self.points_tree.range_sum(lo, hi + 1)
+
+    def conductores_con_puntos(self, puntos): # O(k), k is the number of drivers returned
+        # In the order in which they reached that number of points
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return list(self.points_drivers[puntos])
+
+
+COMMANDS = {
+    **CORE_COMMANDS,
+    "cuantos_en_rango": (int, int),
+    "conductores_con_puntos": (int,),
+}
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    system = RangeLicenseSystem()
+    output = []
+
+    def cuantos_en_rango(lo, hi):
+        count = system.cuantos_en_rango(lo, hi)
+        output.append(f"Entre {lo} y {hi} puntos hay {count}")
+
+    def conductores_con_puntos(puntos):
+        drivers = system.conductores_con_puntos(puntos)
+        output.append(f"Conductores con {puntos} puntos:")
+        output.extend(drivers)
+
+    handlers = {
+        "cuantos_en_rango": cuantos_en_rango,
+        "conductores_con_puntos": conductores_con_puntos,
+    }
+    return licenses.process_program(system, program, COMMANDS, execute, handlers, output)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+import sys
+sys.path.append(".")
+import heapq
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
+
+# Every operation carries the time it happens at (e.g. a day number) as its last
+# argument; times must not decrease along a test case
+COMMANDS = {
+    "nuevo": (str, int),
+    "quitar": (str, int, int),
+    "consultar": (str, int),
+    "cuantos_con_puntos": (int, int),
+}
+
+
+class RecoveringLicenseSystem:
+    # LicenseSystem where drivers recover `recovery` points for every `period` time
+    # units without an infraction, up to 15.
+    # A driver is stored as the points and time of its last infraction (or nuevo),
+    # and consultar computes the current points from them, so nothing is updated
+    # per driver as time goes by. points_count must be exact at any time, so each
+    # driver below 15 points has its next recovery step scheduled in an expiry
+    # queue: a heap of distinct times, each one a bucket of (dni, version) steps.
+    # Moving the clock forward pops only the steps that are due; an infraction
+    # bumps the driver's version, which turns its pending step into a no-op.
+    # Each infraction schedules at most ceil(15 / recovery) steps in total.
+    def __init__(self, period=365, recovery=2):
+        self.period = period
+        self.recovery = recovery
+        self.drivers = {}  # dni -> [points, time, version] at its last infraction
+        self.points_count = [0] * 16  # Tracks number of drivers per points, as of self.now
+        self.now = None
+        self.times = []  # heap of the times with scheduled steps
+        self.steps = {}  # time -> [(dni, version), ...]
+
+    def _points_at(self, driver, time): # O(1)
+        points, since, _ = driver
+        return min(15, points + self.recovery * ((time - since) // self.period))
+
+    def _schedule(self, dni, driver, time): # O(log t), t is the number of distinct pending times
+        bucket = self.steps.get(time)
+        if bucket is None:
+            bucket = self.steps[time] = []
+            heapq.heappush(self.times, time)
+        bucket.append((dni, driver[2]))
+
+    def _advance(self, time): # O(s log t) for the s steps that are due
+        if self.now is not None and time < self.now:
+            raise ValueError("Tiempo no valido")
+        self.now = time
+        times, steps, drivers = self.times, self.steps, self.drivers
+        while times and times[0] <= time:
+            due = heapq.heappop(times)
+            for dni, version in steps.pop(due):
+                driver = drivers[dni]
+                if driver[2] != version:
+                    continue # an infraction after this step was scheduled
+                before = self._points_at(driver, due - 1)
+                after = self._points_at(driver, due)
+                self.points_count[before] -= 1
+                self.points_count[after] += 1
+                if after < 15:
+                    self._schedule(dni, driver, due + self.period)
+
+    def nuevo(self, dni, time): # O(log t) amortized
+        self._advance(time)
+        if dni in self.drivers:
+            raise ValueError("Conductor duplicado")
+        self.drivers[dni] = [15, time, 0]
+        self.points_count[15] += 1
+
+    def quitar(self, dni, puntos, time): # O(log t) amortized
+        self._advance(time)
+        driver = self.drivers.get(dni)
+        if driver is None:
+            raise ValueError("Conductor inexistente")
+
+        current_points = self._points_at(driver, time)
+        new_points = max(0, current_points - puntos)
+        self.points_count[current_points] -= 1
+        self.points_count[new_points] += 1
+        driver[0], driver[1], driver[2] = new_points, time, driver[2] + 1
+        if new_points < 15:
+            self._schedule(dni, driver, time + self.period)
+
+    def consultar(self, dni, time): # O(log t) amortized
+        self._advance(time)
+        driver = self.drivers.get(dni)
+        if driver is None:
+            raise ValueError("Conductor inexistente")
+        return self._points_at(driver, time)
+
+    def cuantos_con_puntos(self, puntos, time): # O(log t) amortized
+        self._advance(time)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return self.points_count[puntos]
+
+
+# Every command takes a time as an extra argument, which the workloads of
+# ads_libs.workload do not generate (ads_libs.discovery skips this file)
+DISCOVERABLE = False
+
+
+def process_operations(operations): # O(p log p), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    system = RecoveringLicenseSystem()
+    output = []
+
+    def consultar(dni, time):
+        points = system.consultar(dni, time)
+        output.append(f"Puntos de {dni}: {points}")
+
+    def cuantos_con_puntos(puntos, time):
+        count = system.cuantos_con_puntos(puntos, time)
+        output.append(f"Con {puntos} puntos hay {count}")
+
+    handlers = {
+        "consultar": consultar,
+        "cuantos_con_puntos": cuantos_con_puntos,
+    }
+    return licenses.process_program(system, program, COMMANDS, execute, handlers, output)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
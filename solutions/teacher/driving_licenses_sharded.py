@@ -0,0 +1,75 @@
+import sys
+sys.path.append(".")
+import threading
+
+from ads_libs import licenses
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
+from solutions.teacher.driving_licenses import CORE_COMMANDS as COMMANDS
+
+
+class _Shard:
+    __slots__ = ("lock", "drivers", "points_count")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.drivers = {}  # Stores drivers and their points
+        self.points_count = [0] * 16  # Tracks number of drivers per points in this shard
+
+
+class ShardedLicenseSystem:
+    # Same ADT as LicenseSystem, safe to share between threads. DNIs are hashed
+    # into independently locked shards, so writers on different shards never wait
+    # for each other. cuantos_con_puntos takes no lock: it adds up the shards'
+    # counters, each of which is always consistent with its own shard, but the sum
+    # is not an atomic snapshot while other threads are writing.
+    def __init__(self, shards=16):
+        self.shards = [_Shard() for _ in range(shards)]
+
+    def _shard(self, dni): # O(1)
+        return self.shards[hash(dni) % len(self.shards)]
+
+    def nuevo(self, dni): # O(1)
+        shard = self._shard(dni)
+        with shard.lock:
+            if dni in shard.drivers:
+                raise ValueError("Conductor duplicado")
+            shard.drivers[dni] = 15
+            shard.points_count[15] += 1
+
+    def quitar(self, dni, puntos): # O(1)
+        shard = self._shard(dni)
+        with shard.lock:
+            current_points = shard.drivers.get(dni)
+            if current_points is None:
+                raise ValueError("Conductor inexistente")
+            new_points = max(0, current_points - puntos)
+            shard.drivers[dni] = new_points
+            shard.points_count[current_points] -= 1
+            shard.points_count[new_points] += 1
+
+    def consultar(self, dni): # O(1), a single dict read needs no lock
+        points = self._shard(dni).drivers.get(dni)
+        if points is None:
+            raise ValueError("Conductor inexistente")
+        return points
+
+    def cuantos_con_puntos(self, puntos): # O(shards)
+        if puntos < 0 or puntos > 15:
+            raise ValueError("Puntos no validos")
+        return sum(shard.points_count[puntos] for shard in self.shards)
+
+
+def process_operations(operations): # O(p), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    return licenses.process_program(ShardedLicenseSystem(), program, COMMANDS, execute)
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+import sys
+sys.path.append(".")
+from collections import OrderedDict
+
+from ads_libs.dispatch import run_compiled, run_operations
+from ads_libs.runner import run
+from ads_libs.treap import Treap
+
+
+class Student:
+    __slots__ = ("name", "surname", "phone_num", "points", "instructor")
+
+    def __init__(self, name, instructor):
+        self.name = name
+        self.surname = ""
+        self.phone_num = ""
+        self.points = 0
+        self.instructor = instructor  # Instructor object
+
+
+class Instructor:
+    __slots__ = ("name", "surname", "phone_num", "roster")
+
+    def __init__(self, name):
+        self.name = name
+        self.surname = ""
+        self.phone_num = ""
+        # Students of this instructor: name -> points, ordered by name and
+        # augmented with the largest points of every subtree
+        self.roster = Treap()
+
+
+class DrivingSchool:
+    def __init__(self, cache_size=1024):
+        self.students = {}  # name -> Student
+        self.instructors = {}  # name -> Instructor
+        # Every student keyed by (-points, name): best first, ties in alphabetical order
+        self.leaderboard = Treap()
+        # LRU cache of examen results: (instructor, points) -> students. A change of
+        # the score of a student of P only invalidates the thresholds of P it crosses.
+        self.cache_size = cache_size
+        self.examen_cache = OrderedDict()
+        self.cached_thresholds = {}  # instructor name -> set of cached points
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def _student(self, name): # O(1)
+        student = self.students.get(name)
+        if student is None:
+            raise ValueError(f"El alumno {name} no esta matriculado.")
+        return student
+
+    def _instructor(self, name): # O(1)
+        instructor = self.instructors.get(name)
+        if instructor is None:
+            instructor = self.instructors[name] = Instructor(name)
+        return instructor
+
+    def _invalidate(self, instructor_name, low, high): # O(c), c is the number of thresholds cached for the instructor
+        # Drops the cached examen of the instructor for every threshold in (low, high]
+        thresholds = self.cached_thresholds.get(instructor_name)
+        if not thresholds:
+            return
+        for points in [points for points in thresholds if low < points <= high]:
+            thresholds.discard(points)
+            del self.examen_cache[instructor_name, points]
+
+    def _invalidate_student(self, student): # O(c), every threshold the student passes
+        self._invalidate(student.instructor.name, float("-inf"), student.points)
+
+    def alta(self, student_name, instructor_name): # O(log m + c), m is the number of students of an instructor
+        instructor = self._instructor(instructor_name)
+        student = self.students.get(student_name)
+        if student is None:
+            student = self.students[student_name] = Student(student_name, instructor)
+            self.leaderboard.insert((0, student_name), 0)
+        elif student.instructor is instructor:
+            return
+        else:
+            self._invalidate_student(student)
+            student.instructor.roster.remove(student_name)
+            student.instructor = instructor
+        instructor.roster.insert(student_name, student.points)
+        self._invalidate_student(student)
+
+    def es_alumno(self, student_name, instructor_name): # O(1)
+        student = self.students.get(student_name)
+        return student is not None and student.instructor.name == instructor_name
+
+    def puntuacion(self, student_name): # O(1)
+        return self._student(student_name).points
+
+    def actualizar(self, student_name, points): # O(log m + c)
+        student = self._student(student_name)
+        before = student.points
+        student.points += points
+        student.instructor.roster.set_value(student_name, student.points)
+        self.leaderboard.remove((-before, student_name))
+        self.leaderboard.insert((-student.points, student_name), student.points)
+        self._invalidate(student.instructor.name, min(before, student.points), max(before, student.points))
+
+    def examen(self, instructor_name, points): # O(k) cached, O(k log m + log m) otherwise; k is the number of students returned
+        # Students of the instructor with at least `points`, in alphabetical order:
+        # the subtrees of the roster whose best student is below `points` are skipped
+        instructor = self.instructors.get(instructor_name)
+        if instructor is None:
+            return []
+        key = (instructor_name, points)
+        students = self.examen_cache.get(key)
+        if students is not None:
+            self.cache_hits += 1
+            self.examen_cache.move_to_end(key)
+            return list(students)
+        self.cache_misses += 1
+        students = instructor.roster.at_least(points)
+        if self.cache_size > 0:
+            self.examen_cache[key] = tuple(students)
+            self.cached_thresholds.setdefault(instructor_name, set()).add(points)
+            if len(self.examen_cache) > self.cache_size:
+                (evicted_name, evicted_points), _ = self.examen_cache.popitem(last=False)
+                self.cached_thresholds[evicted_name].discard(evicted_points)
+        return students
+
+    def aprobar(self, student_name): # O(log m + c)
+        student = self._student(student_name)
+        self._invalidate_student(student)
+        student.instructor.roster.remove(student_name)
+        self.leaderboard.remove((-student.points, student_name))
+        del self.students[student_name]
+
+    def mejores(self, k): # O(k + log n), n is the number of students
+        # The k students with the most points as (name, points), ties in alphabetical order
+        return [(name, -points) for points, name in self.leaderboard.first(k)]
+
+    def rango(self, student_name): # O(log n)
+        # Position of the student in mejores, starting at 1
+        student = self._student(student_name)
+        return self.leaderboard.rank((-student.points, student_name)) + 1
+
+    def transferir_todos(self, old_name, new_name): # O(s log m + c), s is the smaller of the two rosters
+        # Moves every student of old_name to new_name, keeping their points. Only the
+        # smaller roster is moved: when old_name has more students, the two Instructor
+        # records swap names and personal data instead, so the larger roster and the
+        # references of its students stay where they are. A student is only moved into
+        # a roster at least as large as its own, so the merged roster is at least twice
+        # the size of the one it left, and each student moves O(log n) times.
+        old = self.instructors.get(old_name)
+        if old is None or old_name == new_name:
+            return
+        new = self._instructor(new_name)
+        self._invalidate(old_name, float("-inf"), float("inf"))
+        self._invalidate(new_name, float("-inf"), float("inf"))
+        if len(old.roster) > len(new.roster):
+            old.name, new.name = new.name, old.name
+            old.surname, new.surname = new.surname, old.surname
+            old.phone_num, new.phone_num = new.phone_num, old.phone_num
+            self.instructors[old_name], self.instructors[new_name] = new, old
+            old, new = new, old
+        for student_name, points in old.roster.items():
+            self.students[student_name].instructor = new
+            new.roster.insert(student_name, points)
+        old.roster = Treap()
+
+    def fusionar(self, old_name, new_name): # O(s log m + c)
+        # transferir_todos, and old_name stops being an instructor of the school
+        self.transferir_todos(old_name, new_name)
+        if old_name != new_name and old_name in self.instructors:
+            del self.instructors[old_name]
+            self.cached_thresholds.pop(old_name, None)
+
+
+COMMANDS = {
+    "alta": (str, str),
+    "es_alumno": (str, str),
+    "puntuacion": (str,),
+    "actualizar": (str, int),
+    "examen": (str, int),
+    "aprobar": (str,),
+    "mejores": (int,),
+    "rango": (str,),
+    "transferir_todos": (str, str),
+    "fusionar": (str, str),
+}
+
+
+def process_operations(operations): # O(p log m), p is the number of operations
+    return process_program(operations, run_operations)
+
+
+def process_program(program, execute=run_compiled): # a program compiled by ads_libs.dispatch, or operations with run_operations
+    school = DrivingSchool()
+    output = []
+
+    def es_alumno(student, instructor):
+        if school.es_alumno(student, instructor):
+            output.append(f"{student} es alumno de {instructor}")
+        else:
+            output.append(f"{student} no es alumno de {instructor}")
+
+    def puntuacion(student):
+        points = school.puntuacion(student)
+        output.append(f"Puntuacion de {student}: {points}")
+
+    def examen(instructor, points):
+        students = school.examen(instructor, points)
+        output.append(f"Alumnos de {instructor} a examen:")
+        output.extend(students)
+
+    def mejores(k):
+        students = school.mejores(k)
+        output.append(f"Mejores {k} alumnos:")
+        output.extend(f"{student} {points}" for student, points in students)
+
+    def rango(student):
+        position = school.rango(student)
+        output.append(f"Rango de {student}: {position}")
+
+    def error(command, e):
+        output.append("ERROR")
+
+    handlers = {
+        "alta": school.alta,
+        "es_alumno": es_alumno,
+        "puntuacion": puntuacion,
+        "actualizar": school.actualizar,
+        "examen": examen,
+        "aprobar": school.aprobar,
+        "mejores": mejores,
+        "rango": rango,
+        "transferir_todos": school.transferir_todos,
+        "fusionar": school.fusionar,
+    }
+    execute(program, COMMANDS, handlers, error)
+
+    return output
+
+def main():
+    run(process_operations)
+
+
+if __name__ == "__main__":
+    main()